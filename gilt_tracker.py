@@ -5,25 +5,51 @@ and generates an interactive HTML dashboard with a Last Twelve Months view.
 """
 
 import requests
-import csv
-import io
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import re
 import sys
+import time
 import webbrowser
 import json
 import base64
+import calendar
+import gzip
+import hashlib
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster JSON encoding when installed
+except ImportError:
+    orjson = None
+
 
 SERIES_CODE = "IUDMNZC"
 BOE_API_URL = "https://www.bankofengland.co.uk/boeapps/database/_iadb-fromshowcolumns.asp"
 OUTPUT_DIR = Path(__file__).parent
 DASHBOARD_FILE = OUTPUT_DIR / "index.html"
+DASHBOARD_GZ_FILE = OUTPUT_DIR / "index.html.gz"  # precompressed copy for gzip-capable hosts
+DASHBOARD_HASH_FILE = OUTPUT_DIR / "index.html.sha"  # digest of the last page written
+ASSETS_DIR = OUTPUT_DIR / "assets"
 DATA_FILE = OUTPUT_DIR / "gilt_data.json"
 LOGO_FILE = OUTPUT_DIR / "logo.jpg"
 LOGO_FILE_FALLBACK = OUTPUT_DIR.parent / "Branding" / "Fairhurst-Buckley-logo-COLOUR.jpg"
 
+# Local cache of the raw BoE CSV; the series only updates once per business day.
+# Set GILT_TRACKER_NO_CACHE=1 to always fetch fresh data.
+BOE_CACHE_FILE = OUTPUT_DIR / ".boe_cache.json"
+BOE_CACHE_TTL = 6 * 60 * 60  # seconds
+
+# Set GILT_TRACKER_DEBUG=1 to emit the page's CSS and JS unminified and to embed
+# every chart point without downsampling.
+DEBUG = bool(os.environ.get("GILT_TRACKER_DEBUG"))
+
 # CNBC quote API for live benchmark 30-year gilt bond yield (matches FT figure)
 CNBC_API_URL = (
     "https://quote.cnbc.com/quote-html-webservice/restQuote/symbolType/symbol"
@@ -31,9 +57,30 @@ CNBC_API_URL = (
     "&fund=1&exthrs=1&output=json&events=1"
 )
 
+# Date formats: CNBC's 52-week high/low dates, and how dates are shown on the page
+CNBC_DATE_FORMAT = "%m/%d/%y"
+DISPLAY_DATE_FORMAT = "%d %b %Y"
+
 # Typical lending margin over gilts for UK commercial property (bps)
 PROPERTY_LENDING_SPREAD_BPS = 175
 
+# Most points embedded per chart series; longer series are M4-downsampled
+# (a year of daily BoE data is ~260 points, well under this)
+MAX_CHART_POINTS = 1200
+
+# Shared HTTP session so the BoE and CNBC calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
 
 def fetch_gilt_data():
     """Fetch 30-year gilt yield data from Bank of England API for the last 12 months."""
@@ -55,106 +102,227 @@ def fetch_gilt_data():
     }
 
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
+    cache_key = f"{date_from}|{date_to}"
+    use_cache = not os.environ.get("GILT_TRACKER_NO_CACHE")
+    if use_cache:
+        cached_body = read_boe_cache(cache_key)
+        if cached_body is not None:
+            print(f"Using cached gilt data from {date_from} to {date_to}...")
+            return parse_boe_csv(cached_body.splitlines())
+
     print(f"Fetching gilt data from {date_from} to {date_to}...")
-    response = requests.get(BOE_API_URL, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
+    raw_lines = []
 
-    return parse_boe_csv(response.text)
+    def tee_lines(lines):
+        for line in lines:
+            raw_lines.append(line)
+            yield line
 
+    with SESSION.get(BOE_API_URL, params=params, headers=headers, timeout=(5, 30), stream=True) as response:
+        response.raise_for_status()
+        if response.encoding is None:
+            response.encoding = "utf-8"
+        # Parse rows as they arrive rather than materialising the whole body first
+        data_points = parse_boe_csv(tee_lines(response.iter_lines(decode_unicode=True)))
 
-def parse_boe_csv(csv_text):
-    """Parse the Bank of England CSV response into a list of {date, yield} dicts."""
-    data_points = []
-    reader = csv.reader(io.StringIO(csv_text))
+    if use_cache and data_points:
+        write_boe_cache(cache_key, "\n".join(raw_lines))
+    return data_points
 
-    header_found = False
-    date_col = None
-    yield_col = None
 
-    for row in reader:
-        if not row or all(cell.strip() == "" for cell in row):
-            continue
+def read_boe_cache(cache_key):
+    """Return the cached BoE CSV body if it matches the request and is within the TTL."""
+    try:
+        with open(BOE_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("params_key") != cache_key:
+        return None
+    if time.time() - cached.get("fetched_at", 0) >= BOE_CACHE_TTL:
+        return None
+    return cached.get("body")
 
-        # Find the header row containing "DATE" and the series code
-        if not header_found:
-            upper_row = [cell.strip().upper() for cell in row]
-            if "DATE" in upper_row:
-                date_col = upper_row.index("DATE")
-                for i, cell in enumerate(upper_row):
-                    if SERIES_CODE in cell:
-                        yield_col = i
-                        break
-                if yield_col is not None:
-                    header_found = True
-                continue
-
-        if not header_found:
-            continue
 
-        # Parse data rows
+def write_boe_cache(cache_key, body):
+    """Atomically replace the BoE cache file with a freshly fetched body."""
+    try:
+        _write_atomic(BOE_CACHE_FILE, _json_bytes({"fetched_at": time.time(), "params_key": cache_key, "body": body}))
+    except OSError as e:
+        print(f"Warning: Could not write BoE cache: {e}")
+
+
+def parse_boe_csv(lines):
+    """Parse Bank of England CSV lines into a list of {date, yield} dicts."""
+    data_points = []
+    append = data_points.append
+
+    # With CSVF=TN and a single series code the BoE returns a fixed two-column
+    # layout (DATE, <series>) with no quoted fields, so a plain split is enough.
+    # Anything that doesn't parse as a date and a yield (the header, blank
+    # lines) is simply skipped.
+    for line in lines:
+        parts = line.split(",")
+        if len(parts) < 2:
+            continue
         try:
-            date_str = row[date_col].strip()
-            yield_str = row[yield_col].strip()
-            if not date_str or not yield_str:
-                continue
-
-            date_obj = parse_boe_date(date_str)
-            yield_val = float(yield_str)
-            data_points.append({
-                "date": date_obj.strftime("%Y-%m-%d"),
-                "yield": round(yield_val, 4),
-            })
-        except (ValueError, IndexError):
+            yield_val = float(parts[1])
+            date_obj = parse_boe_date(parts[0].strip())
+        except ValueError:
             continue
+        append({
+            "date": date_obj.date().isoformat(),
+            "yield": round(yield_val, 4),
+        })
 
     data_points.sort(key=lambda x: x["date"])
     print(f"Parsed {len(data_points)} data points.")
     return data_points
 
 
+def _json_dumps(obj, indent=False):
+    """Serialise to a JSON string, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_bytes(obj, indent=False):
+    """Serialise to UTF-8 JSON bytes; orjson produces bytes directly."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return _json_dumps(obj, indent=indent).encode("utf-8")
+
+
+def _pack_b64(typecode, values):
+    """Pack numbers little-endian as an array typecode and base64 them for a JS typed array."""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def _write_atomic(path, chunks, compress=False):
+    """Write bytes, or a sequence of byte chunks, via a temp file and os.replace.
+
+    An interrupted run never leaves a partial file. Chunks are streamed straight to
+    the file rather than joined first; compress=True gzips them on the way (mtime=0
+    so the same content always produces the same file).
+    """
+    if isinstance(chunks, (bytes, bytearray)):
+        chunks = (chunks,)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        if compress:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=f, compresslevel=9, mtime=0) as gz:
+                gz.writelines(chunks)
+        else:
+            f.writelines(chunks)
+    os.replace(tmp_path, path)
+
+
+def _digest(chunks):
+    """Short blake2b hex digest of a sequence of byte chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_digest(path):
+    """Return the digest stored at path, or None if there isn't one."""
+    try:
+        return path.read_text(encoding="ascii").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _strptime(date_str, fmt):
+    """Memoized datetime.strptime; the same few hundred dates are parsed repeatedly."""
+    return datetime.strptime(date_str, fmt)
+
+
+def _parse_iso(date_str):
+    """Parse a YYYY-MM-DD date; fromisoformat is implemented in C and far cheaper than strptime."""
+    return datetime.fromisoformat(date_str)
+
+
+# Candidate BoE date formats; whichever last matched is moved to the front
+_BOE_DATE_FORMATS = ["%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%Y-%m-%d"]
+
+
 def parse_boe_date(date_str):
-    """Parse a BoE date string, trying multiple formats."""
-    formats = ["%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%Y-%m-%d"]
-    for fmt in formats:
+    """Parse a BoE date string, trying multiple formats (last successful one first)."""
+    for i, fmt in enumerate(_BOE_DATE_FORMATS):
         try:
-            return datetime.strptime(date_str, fmt)
+            date_obj = _strptime(date_str, fmt)
         except ValueError:
             continue
+        if i:
+            _BOE_DATE_FORMATS.insert(0, _BOE_DATE_FORMATS.pop(i))
+        return date_obj
     raise ValueError(f"Cannot parse date: {date_str}")
 
 
-def compute_stats(data_points):
+def index_series(data_points):
+    """Build a column-wise view of the data (dates, date ordinals, yields) for stats and lookups."""
+    dates = [d["date"] for d in data_points]
+    return {
+        "dates": dates,
+        "ordinals": array("l", [_parse_iso(d).toordinal() for d in dates]),
+        "yields": array("d", [d["yield"] for d in data_points]),
+    }
+
+
+def compute_stats(data_points, series=None):
     """Compute summary statistics from the data."""
     if not data_points:
         return {}
+    if series is None:
+        series = index_series(data_points)
+
+    # Single pass for the 12-month high/low and where they occurred, over the points
+    # within 365 days of the latest one (the fetch window can reach a day or two further)
+    yields = series["yields"]
+    ordinals = series["ordinals"]
+    start = bisect_left(ordinals, ordinals[-1] - 365)
+    hi = lo = yields[start]
+    hi_i = lo_i = start
+    for i in range(start + 1, len(yields)):
+        y = yields[i]
+        if y > hi:
+            hi, hi_i = y, i
+        elif y < lo:
+            lo, lo_i = y, i
 
-    yields = [d["yield"] for d in data_points]
     current = data_points[-1]
     previous = data_points[-2] if len(data_points) >= 2 else data_points[-1]
 
     # Find 1-week-ago and 1-month-ago values
-    current_date = datetime.strptime(current["date"], "%Y-%m-%d")
+    current_date = datetime.fromordinal(ordinals[-1])
     week_ago_target = current_date - timedelta(days=7)
     month_ago_target = current_date - timedelta(days=30)
     year_start = datetime(current_date.year, 1, 1)
 
-    week_ago_val = find_nearest_value(data_points, week_ago_target)
-    month_ago_val = find_nearest_value(data_points, month_ago_target)
-    ytd_start_val = find_nearest_value(data_points, year_start)
+    week_ago_val = find_nearest_value(series, week_ago_target)
+    month_ago_val = find_nearest_value(series, month_ago_target)
+    ytd_start_val = find_nearest_value(series, year_start)
 
     return {
         "current_yield": current["yield"],
         "current_date": current["date"],
         "previous_yield": previous["yield"],
         "daily_change": round(current["yield"] - previous["yield"], 4),
-        "high_12m": round(max(yields), 4),
-        "low_12m": round(min(yields), 4),
-        "high_date": data_points[yields.index(max(yields))]["date"],
-        "low_date": data_points[yields.index(min(yields))]["date"],
+        "high_12m": round(hi, 4),
+        "low_12m": round(lo, 4),
+        "high_date": data_points[hi_i]["date"],
+        "low_date": data_points[lo_i]["date"],
         "week_change": round(current["yield"] - week_ago_val, 4) if week_ago_val else None,
         "month_change": round(current["yield"] - month_ago_val, 4) if month_ago_val else None,
         "ytd_change": round(current["yield"] - ytd_start_val, 4) if ytd_start_val else None,
@@ -162,17 +330,60 @@ def compute_stats(data_points):
     }
 
 
-def find_nearest_value(data_points, target_date):
-    """Find the yield value nearest to a target date."""
-    target_str = target_date.strftime("%Y-%m-%d")
-    best = None
-    best_diff = None
-    for d in data_points:
-        diff = abs((datetime.strptime(d["date"], "%Y-%m-%d") - target_date).days)
-        if best_diff is None or diff < best_diff:
-            best_diff = diff
-            best = d["yield"]
-    return best
+def find_nearest_value(series, target_date):
+    """Find the yield value nearest to a target date (earlier point wins ties)."""
+    ordinals = series["ordinals"]
+    if not ordinals:
+        return None
+    target = target_date.toordinal()
+    i = bisect_left(ordinals, target)
+    if i == 0:
+        best = 0
+    elif i == len(ordinals):
+        best = i - 1
+    else:
+        best = i if ordinals[i] - target < target - ordinals[i - 1] else i - 1
+    return series["yields"][best]
+
+
+def months_before(dt, months):
+    """Return dt shifted back by whole calendar months, clamping to the month's last day."""
+    year, month = divmod(dt.year * 12 + dt.month - 1 - months, 12)
+    day = min(dt.day, calendar.monthrange(year, month + 1)[1])
+    return dt.replace(year=year, month=month + 1, day=day)
+
+
+def moving_average(values, window=30):
+    """Trailing simple moving average via a rolling sum; None until a full window exists."""
+    sma = [None] * len(values)
+    total = 0.0
+    for i, v in enumerate(values):
+        total += v
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            sma[i] = total / window
+    return sma
+
+
+def m4_indices(values, max_points):
+    """Indices kept by M4 downsampling, in order: first, last, min and max of each bucket.
+
+    The series is split into max_points // 4 equal index buckets, which preserves the
+    drawn line's extremes. Returns range(len(values)) when no downsampling is needed.
+    """
+    n = len(values)
+    buckets = max_points // 4
+    if n <= max_points or buckets < 1:
+        return range(n)
+    keep = []
+    for b in range(buckets):
+        lo, hi = b * n // buckets, (b + 1) * n // buckets
+        bucket = range(lo, hi)
+        i_min = min(bucket, key=values.__getitem__)
+        i_max = max(bucket, key=values.__getitem__)
+        keep.extend(sorted({lo, i_min, i_max, hi - 1}))
+    return keep
 
 
 def save_data(data_points, stats):
@@ -183,23 +394,30 @@ def save_data(data_points, stats):
         "stats": stats,
         "data": data_points,
     }
-    with open(DATA_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    _write_atomic(DATA_FILE, _json_bytes(output, indent=True))
     print(f"Data saved to {DATA_FILE}")
 
 
+@lru_cache(maxsize=4)
+def _encode_logo(path_str, mtime):
+    """Read and base64-encode a logo file; keyed on mtime so edits are picked up."""
+    with open(path_str, "rb") as f:
+        data = f.read()
+    if len(data) < 1000:
+        return ""
+    b64 = base64.b64encode(data).decode("utf-8")
+    return f"data:image/jpeg;base64,{b64}"
+
+
 def load_logo_base64():
     """Load the Fairhurst Buckley logo and return as a base64 data URI."""
     for path in [LOGO_FILE, LOGO_FILE_FALLBACK]:
         try:
-            with open(path, "rb") as f:
-                data = f.read()
-            if len(data) < 1000:
-                continue
-            b64 = base64.b64encode(data).decode("utf-8")
-            return f"data:image/jpeg;base64,{b64}"
+            data_uri = _encode_logo(str(path), path.stat().st_mtime)
         except FileNotFoundError:
             continue
+        if data_uri:
+            return data_uri
     print("Warning: No valid logo file found")
     return ""
 
@@ -208,10 +426,9 @@ def fetch_live_gilt_yield():
     """Fetch live 30-year gilt benchmark bond yield from CNBC (matches FT figure)."""
     try:
         headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "application/json",
         }
-        response = requests.get(CNBC_API_URL, headers=headers, timeout=15)
+        response = SESSION.get(CNBC_API_URL, headers=headers, timeout=(5, 15))
         response.raise_for_status()
         data = response.json()
 
@@ -256,148 +473,912 @@ def fetch_live_gilt_yield():
         return None
 
 
-def generate_dashboard(data_points, stats, live_data=None):
-    """Generate the HTML dashboard file."""
-    dates_json = json.dumps([d["date"] for d in data_points])
-    updated_time = datetime.now().strftime("%d %b %Y at %H:%M")
-    logo_data_uri = load_logo_base64()
+# Page stylesheet. Written once as a content-hashed file under assets/ and linked
+# from the head, so browsers can cache it across renders.
+DASHBOARD_CSS = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Century Gothic', CenturyGothic, Nunito, sans-serif;
+    background: #ffffff;
+    color: #32373c;
+    min-height: 100vh;
+}
+
+/* ── Header ── */
+.header {
+    background: #ffffff;
+    border-bottom: 3px solid #7ebc3b;
+    padding: 20px 40px;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    flex-wrap: wrap;
+    gap: 16px;
+}
+
+.header-left {
+    display: flex;
+    align-items: center;
+    gap: 20px;
+}
+
+.header-title h1 {
+    font-size: 22px;
+    font-weight: 700;
+    color: #32373c;
+}
+
+.header-title p {
+    font-size: 13px;
+    color: #6b7280;
+    margin-top: 2px;
+}
+
+.header-right {
+    display: flex;
+    align-items: center;
+    gap: 24px;
+}
+
+.header-meta {
+    text-align: right;
+    font-size: 12px;
+    color: #6b7280;
+}
+
+.header-logo img {
+    height: 48px;
+    width: auto;
+}
+
+/* ── Yield Hero ── */
+.yield-hero {
+    background: #f9fafb;
+    border-bottom: 1px solid #e5e7eb;
+    padding: 32px 40px;
+    display: flex;
+    align-items: flex-end;
+    gap: 32px;
+    flex-wrap: wrap;
+}
+
+.yield-current {
+    display: flex;
+    align-items: baseline;
+    gap: 8px;
+    flex-wrap: wrap;
+}
+
+.yield-value {
+    font-size: 56px;
+    font-weight: 700;
+    color: #32373c;
+    letter-spacing: -2px;
+    line-height: 1;
+}
+
+.yield-unit {
+    font-size: 24px;
+    color: #6b7280;
+    font-weight: 400;
+}
+
+.yield-time {
+    width: 100%;
+    font-size: 12px;
+    color: #9ca3af;
+    font-weight: 400;
+    letter-spacing: 0;
+    margin-top: 2px;
+}
+
+.yield-change {
+    display: flex;
+    flex-direction: column;
+    gap: 4px;
+    padding-bottom: 6px;
+}
+
+.change-badge {
+    display: inline-flex;
+    align-items: center;
+    gap: 4px;
+    padding: 4px 12px;
+    border-radius: 9999px;
+    font-size: 13px;
+    font-weight: 700;
+}
+
+.change-badge.positive {
+    background: rgba(126, 188, 59, 0.12);
+    color: #5a9a1f;
+}
+
+.change-badge.negative {
+    background: rgba(220, 38, 38, 0.08);
+    color: #dc2626;
+}
+
+.change-label {
+    font-size: 11px;
+    color: #6b7280;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+/* ── Summary Callout ── */
+.summary-callout {
+    background: #f0f9eb;
+    border-bottom: 1px solid #c8e6a5;
+    padding: 16px 40px;
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    font-size: 14px;
+    color: #32373c;
+    line-height: 1.5;
+}
+
+.summary-callout .sc-icon {
+    font-size: 20px;
+    flex-shrink: 0;
+}
+
+.summary-callout strong {
+    color: #32373c;
+}
+
+.summary-callout .sc-highlight {
+    font-weight: 700;
+    color: #7ebc3b;
+}
+
+
+/* ── Container ── */
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    padding: 28px 40px;
+}
+
+/* ── Stat Cards ── */
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 16px;
+    margin-bottom: 28px;
+}
+
+.stat-card {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 20px;
+    transition: box-shadow 0.2s;
+}
+
+.stat-card:hover {
+    box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+}
+
+.stat-label {
+    font-size: 11px;
+    color: #6b7280;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-bottom: 8px;
+}
+
+.stat-value {
+    font-size: 24px;
+    font-weight: 700;
+    color: #32373c;
+}
+
+.stat-sub {
+    font-size: 12px;
+    color: #9ca3af;
+    margin-top: 4px;
+}
+
+.stat-value.positive { color: #5a9a1f; }
+.stat-value.negative { color: #dc2626; }
+
+/* ── Chart ── */
+.chart-container {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 24px;
+    margin-bottom: 28px;
+}
+
+.chart-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+    flex-wrap: wrap;
+    gap: 12px;
+}
+
+.timeframe-btns {
+    display: flex;
+    gap: 6px;
+}
+
+.tf-btn {
+    padding: 5px 14px;
+    border-radius: 6px;
+    border: 1px solid #e5e7eb;
+    background: #fff;
+    color: #6b7280;
+    font-size: 12px;
+    font-weight: 600;
+    cursor: pointer;
+    font-family: inherit;
+    transition: all 0.15s;
+}
+
+.tf-btn:hover {
+    border-color: #7ebc3b;
+    color: #7ebc3b;
+}
+
+.tf-btn.active {
+    background: #7ebc3b;
+    color: #fff;
+    border-color: #7ebc3b;
+}
+
+.chart-title {
+    font-size: 16px;
+    font-weight: 700;
+    color: #32373c;
+}
+
+.chart-subtitle {
+    font-size: 13px;
+    color: #6b7280;
+}
+
+.chart-wrapper {
+    position: relative;
+    height: 450px;
+}
+
+/* ── Trend Summary ── */
+.trend-summary {
+    background: #f9fafb;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 16px 22px;
+    margin-bottom: 28px;
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    font-size: 14px;
+    color: #32373c;
+    line-height: 1.5;
+}
+
+.trend-summary .trend-icon {
+    font-size: 22px;
+    flex-shrink: 0;
+}
+
+.trend-summary .trend-direction {
+    font-weight: 700;
+}
+
+.trend-summary .trend-favourable {
+    color: #5a9a1f;
+}
+
+.trend-summary .trend-adverse {
+    color: #dc2626;
+}
+
+.trend-summary .trend-bps {
+    font-weight: 700;
+    color: #6b7280;
+}
+
+/* ── Implied Value Chart ── */
+.value-chart-container {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    max-height: 0;
+    overflow: hidden;
+    opacity: 0;
+    transition: max-height 0.5s ease, opacity 0.4s ease, padding 0.5s ease, margin 0.5s ease;
+    padding: 0 24px;
+    margin-bottom: 0;
+}
+
+.value-chart-container.visible {
+    max-height: 600px;
+    opacity: 1;
+    padding: 24px;
+    margin-bottom: 28px;
+}
+
+.value-chart-wrapper {
+    position: relative;
+    height: 400px;
+}
+
+/* ── Property Context ── */
+.context-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 20px;
+    margin-bottom: 28px;
+}
+
+.context-card {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 24px;
+}
+
+.context-card h3 {
+    font-size: 15px;
+    font-weight: 700;
+    color: #32373c;
+    margin-bottom: 14px;
+    padding-bottom: 12px;
+    border-bottom: 2px solid #7ebc3b;
+}
+
+.context-body {
+    font-size: 14px;
+    color: #4b5563;
+    line-height: 1.7;
+}
+
+.context-body strong {
+    color: #32373c;
+}
+
+.context-highlight {
+    background: #f0f9eb;
+    border-left: 4px solid #7ebc3b;
+    border-radius: 0 8px 8px 0;
+    padding: 14px 18px;
+    margin-top: 14px;
+    font-size: 13px;
+    color: #32373c;
+    line-height: 1.6;
+}
+
+
+/* ── Property Calculator ── */
+.calculator {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 28px;
+    margin-bottom: 28px;
+}
+
+.calculator h3 {
+    font-size: 17px;
+    font-weight: 700;
+    color: #32373c;
+    margin-bottom: 6px;
+}
+
+.calculator .calc-subtitle {
+    font-size: 13px;
+    color: #6b7280;
+    margin-bottom: 24px;
+}
+
+.calc-layout {
+    display: grid;
+    grid-template-columns: 300px 1fr;
+    gap: 32px;
+    align-items: start;
+}
+
+.calc-inputs {
+    display: flex;
+    flex-direction: column;
+    gap: 16px;
+}
+
+.calc-field label {
+    display: block;
+    font-size: 11px;
+    font-weight: 700;
+    color: #6b7280;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-bottom: 6px;
+}
+
+.calc-field .input-wrap {
+    position: relative;
+}
+
+.calc-field .input-wrap .prefix,
+.calc-field .input-wrap .suffix {
+    position: absolute;
+    top: 50%;
+    transform: translateY(-50%);
+    font-size: 14px;
+    color: #9ca3af;
+    pointer-events: none;
+}
+
+.calc-field .input-wrap .prefix {
+    left: 14px;
+}
+
+.calc-field .input-wrap .suffix {
+    right: 14px;
+}
+
+.calc-field input {
+    width: 100%;
+    padding: 10px 14px;
+    border: 1px solid #e5e7eb;
+    border-radius: 8px;
+    font-family: 'Century Gothic', CenturyGothic, Nunito, sans-serif;
+    font-size: 15px;
+    font-weight: 700;
+    color: #32373c;
+    background: #f9fafb;
+    transition: border-color 0.2s;
+}
+
+.calc-field input:focus {
+    outline: none;
+    border-color: #7ebc3b;
+    box-shadow: 0 0 0 3px rgba(126, 188, 59, 0.15);
+}
+
+.calc-field input.has-prefix {
+    padding-left: 28px;
+}
+
+.calc-field input.has-suffix {
+    padding-right: 32px;
+}
+
+.calc-toggle-row {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 6px;
+}
+
+.calc-toggle-row label {
+    margin-bottom: 0;
+}
+
+.calc-toggle {
+    display: flex;
+    gap: 2px;
+    background: #f3f4f6;
+    border-radius: 6px;
+    padding: 2px;
+}
+
+.ct-btn {
+    padding: 3px 10px;
+    border: none;
+    border-radius: 5px;
+    background: transparent;
+    color: #6b7280;
+    font-size: 11px;
+    font-weight: 600;
+    cursor: pointer;
+    font-family: inherit;
+    transition: all 0.15s;
+}
+
+.ct-btn.active {
+    background: #7ebc3b;
+    color: #fff;
+}
+
+.calc-derived {
+    font-size: 12px;
+    color: #7ebc3b;
+    font-weight: 600;
+    margin-top: 6px;
+}
+
+.calc-slider {
+    margin-top: 4px;
+}
+
+.calc-slider label {
+    display: block;
+    font-size: 11px;
+    font-weight: 700;
+    color: #6b7280;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-bottom: 8px;
+}
+
+.calc-slider input[type="range"] {
+    -webkit-appearance: none;
+    appearance: none;
+    width: 100%;
+    height: 6px;
+    border-radius: 3px;
+    background: #e5e7eb;
+    outline: none;
+    cursor: pointer;
+}
+
+.calc-slider input[type="range"]::-webkit-slider-thumb {
+    -webkit-appearance: none;
+    appearance: none;
+    width: 20px;
+    height: 20px;
+    border-radius: 50%;
+    background: #7ebc3b;
+    border: 2px solid #ffffff;
+    box-shadow: 0 1px 4px rgba(0,0,0,0.15);
+    cursor: pointer;
+}
+
+.calc-slider input[type="range"]::-moz-range-thumb {
+    width: 20px;
+    height: 20px;
+    border-radius: 50%;
+    background: #7ebc3b;
+    border: 2px solid #ffffff;
+    box-shadow: 0 1px 4px rgba(0,0,0,0.15);
+    cursor: pointer;
+}
+
+.calc-slider .slider-value {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    margin-top: 8px;
+}
+
+.calc-slider .slider-pct {
+    font-size: 22px;
+    font-weight: 700;
+    color: #7ebc3b;
+}
+
+.calc-slider .slider-desc {
+    font-size: 12px;
+    color: #9ca3af;
+    text-align: right;
+}
+
+.calc-results {
+    min-height: 100%;
+}
+
+/* Placeholder and results are swapped by toggling .visible on each; both are
+   layout/paint contained so the swap does not relayout the rest of the page */
+.calc-results-placeholder {
+    display: none;
+    contain: layout paint;
+    align-items: center;
+    justify-content: center;
+    min-height: 200px;
+    color: #9ca3af;
+    font-size: 14px;
+    text-align: center;
+    border: 2px dashed #e5e7eb;
+    border-radius: 10px;
+    padding: 24px;
+}
+
+.calc-results-placeholder.visible {
+    display: flex;
+}
+
+.calc-results-content {
+    display: none;
+    contain: layout paint;
+}
+
+.calc-results-content.visible {
+    display: block;
+}
+
+.calc-base-val {
+    display: flex;
+    align-items: center;
+    gap: 16px;
+    background: #f9fafb;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 18px 22px;
+    margin-bottom: 18px;
+}
+
+.calc-base-val .cbv-value {
+    font-size: 28px;
+    font-weight: 700;
+    color: #32373c;
+    white-space: nowrap;
+}
+
+.calc-base-val .cbv-label {
+    font-size: 13px;
+    color: #6b7280;
+    line-height: 1.4;
+}
+
+.calc-scenario-table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 13px;
+}
+
+.calc-scenario-table th {
+    text-align: left;
+    color: #6b7280;
+    font-weight: 700;
+    padding: 8px 12px;
+    border-bottom: 2px solid #e5e7eb;
+    font-size: 11px;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+.calc-scenario-table td {
+    padding: 9px 12px;
+    color: #4b5563;
+    border-bottom: 1px solid #f3f4f6;
+}
+
+.calc-scenario-table tr.scenario-current td {
+    color: #32373c;
+    font-weight: 700;
+    background: #f0f9eb;
+}
+
+.calc-scenario-table td.val-positive {
+    color: #5a9a1f;
+    font-weight: 700;
+}
+
+.calc-scenario-table td.val-negative {
+    color: #dc2626;
+    font-weight: 700;
+}
+
+@media (max-width: 900px) {
+    .calc-layout {
+        grid-template-columns: 1fr;
+    }
+}
+
+/* ── Footer ── */
+.footer {
+    text-align: center;
+    padding: 24px 40px;
+    font-size: 12px;
+    color: #9ca3af;
+    border-top: 1px solid #e5e7eb;
+}
+
+.footer a {
+    color: #7ebc3b;
+    text-decoration: none;
+}
+
+/* ── Data Note ── */
+.data-note {
+    background: #f9fafb;
+    border: 1px solid #e5e7eb;
+    border-radius: 10px;
+    padding: 16px 20px;
+    margin-bottom: 28px;
+    font-size: 11px;
+    color: #6b7280;
+    line-height: 1.6;
+}
+
+.data-note h4 {
+    font-size: 11px;
+    font-weight: 700;
+    color: #32373c;
+    margin-bottom: 6px;
+}
+
+.data-note p {
+    margin-bottom: 8px;
+}
+
+.data-note p:last-child {
+    margin-bottom: 0;
+}
+
+/* ── Responsive ── */
+@media (max-width: 900px) {
+    .context-grid {
+        grid-template-columns: 1fr;
+    }
+}
 
-    # Determine whether we have live market data
-    has_live = live_data is not None and live_data.get("yield") is not None
+@media (max-width: 768px) {
+    .header {
+        padding: 10px 16px;
+        flex-wrap: nowrap;
+    }
 
-    # Adjust historical BoE chart data up to benchmark level if we have live data.
-    # We match the CNBC date to the nearest BoE data point for an accurate spread,
-    # then sanity-check it falls within the expected 0.40–1.00% range.
-    if has_live:
-        # Find the BoE data point closest to the CNBC quote date
-        try:
-            cnbc_ts = live_data["last_time"].split("T")[0]
-            cnbc_date = datetime.strptime(cnbc_ts, "%Y-%m-%d")
-        except (ValueError, KeyError, IndexError):
-            cnbc_date = datetime.strptime(stats["current_date"], "%Y-%m-%d")
-        matched_boe = find_nearest_value(data_points, cnbc_date)
-        if matched_boe is None:
-            matched_boe = stats["current_yield"]
+    .header-left {
+        gap: 10px;
+        flex: 1;
+        min-width: 0;
+    }
 
-        spread = round(live_data["yield"] - matched_boe, 4)
+    .header-title h1 {
+        font-size: 14px;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
 
-        # Sanity check: benchmark-vs-zero-coupon spread is typically 0.40–1.00%.
-        # If it's outside this range, something is wrong — fall back to no adjustment.
-        SPREAD_MIN, SPREAD_MAX = 0.40, 1.00
-        if SPREAD_MIN <= spread <= SPREAD_MAX:
-            yields_json = json.dumps([round(d["yield"] + spread, 4) for d in data_points])
-            spread_ok = True
-        else:
-            print(f"  Warning: Benchmark spread {spread:.2f}% outside expected range "
-                  f"({SPREAD_MIN}–{SPREAD_MAX}%). Using unadjusted BoE data.")
-            yields_json = json.dumps([d["yield"] for d in data_points])
-            spread_ok = False
-            spread = 0
-    else:
-        spread = 0
-        spread_ok = False
-        yields_json = json.dumps([d["yield"] for d in data_points])
+    .header-title p {
+        font-size: 10px;
+        display: none;
+    }
 
-    stats_json = json.dumps(stats)
+    .header-right {
+        flex-direction: row-reverse;
+        align-items: center;
+        gap: 10px;
+        flex-shrink: 0;
+    }
 
-    def fmt_change(val):
-        if val is None:
-            return "N/A", ""
-        sign = "+" if val >= 0 else ""
-        css = "positive" if val > 0 else "negative" if val < 0 else ""
-        return f"{sign}{val:.2f}%", css
+    .header-meta {
+        display: none;
+    }
 
-    # Use live CNBC daily change if available, BoE for period changes
-    if has_live:
-        daily_str, daily_css = fmt_change(live_data.get("change"))
-    else:
-        daily_str, daily_css = fmt_change(stats.get("daily_change"))
-    week_str, week_css = fmt_change(stats.get("week_change"))
-    month_str, month_css = fmt_change(stats.get("month_change"))
-    ytd_str, ytd_css = fmt_change(stats.get("ytd_change"))
+    .header-logo img {
+        height: 28px;
+    }
 
-    # Use live yield as headline if available, else fall back to BoE
-    if has_live:
-        current_yield = live_data["yield"]
-        headline_source = "Live"
-    else:
-        current_yield = stats["current_yield"]
-        headline_source = "BoE"
+    .yield-hero {
+        padding: 20px 16px;
+        gap: 16px;
+    }
 
-    implied_borrowing = current_yield + PROPERTY_LENDING_SPREAD_BPS / 100
-    yield_3m_ago = find_nearest_value(
-        data_points,
-        datetime.strptime(stats["current_date"], "%Y-%m-%d") - timedelta(days=90),
-    )
-    yield_direction = "fallen" if stats.get("month_change", 0) < 0 else "risen"
-    direction_impact = "reducing" if yield_direction == "fallen" else "increasing"
-    valuation_impact = "upward" if yield_direction == "fallen" else "downward"
+    .yield-value {
+        font-size: 40px;
+    }
 
-    # 12-month high/low: prefer CNBC 52-week data if available
-    if has_live and live_data.get("yr_high") is not None:
-        high_12m = live_data["yr_high"]
-        low_12m = live_data["yr_low"]
-        high_12m_date = live_data.get("yr_high_date", "")
-        low_12m_date = live_data.get("yr_low_date", "")
-        # CNBC dates are MM/DD/YY format — convert for display
-        def cnbc_date_display(d):
-            if not d:
-                return ""
-            try:
-                dt = datetime.strptime(d, "%m/%d/%y")
-                return dt.strftime("%d %b %Y")
-            except ValueError:
-                return d
-        high_12m_display = cnbc_date_display(high_12m_date)
-        low_12m_display = cnbc_date_display(low_12m_date)
-    else:
-        high_12m = stats["high_12m"]
-        low_12m = stats["low_12m"]
-        high_12m_display = format_date_display(stats["high_date"])
-        low_12m_display = format_date_display(stats["low_date"])
+    .yield-change {
+        padding-bottom: 0;
+    }
 
-    # Month-ago borrowing cost for summary callout
-    month_change = stats.get("month_change", 0)
-    month_bps = abs(month_change) * 100
-    month_ago_yield = current_yield - month_change
-    borrowing_verb = "reducing" if month_change < 0 else "increasing"
+    .change-badge {
+        font-size: 12px;
+        padding: 3px 10px;
+    }
 
-    # Data freshness info
-    live_time_short = ""  # compact time for yield hero (e.g. "09:26 GMT")
-    if has_live and live_data.get("last_time"):
-        # Parse CNBC timestamp like "2026-02-26T09:22:08.000+0000"
-        try:
-            live_ts = live_data["last_time"].replace("+0000", "+00:00").split(".")[0]
-            live_dt = datetime.strptime(live_ts, "%Y-%m-%dT%H:%M:%S")
-            data_freshness = f"Live: {live_dt.strftime('%d %b %Y at %H:%M')} GMT"
-            live_time_short = f"as at {live_dt.strftime('%d %b %Y')}, {live_dt.strftime('%H:%M')} GMT"
-        except (ValueError, IndexError):
-            data_freshness = "Live market data"
-            live_time_short = "live"
-    else:
-        latest_data_date = datetime.strptime(stats["current_date"], "%Y-%m-%d")
-        data_lag_days = (datetime.now() - latest_data_date).days
-        latest_data_display = format_date_display(stats["current_date"])
-        data_freshness = f"Latest data: {latest_data_display} ({data_lag_days}d lag)"
+    .summary-callout {
+        padding: 12px 16px;
+        font-size: 12px;
+        line-height: 1.6;
+    }
 
-    # Bond details for display
-    bond_coupon = live_data.get("coupon", "") if has_live else ""
-    raw_maturity = live_data.get("maturity", "") if has_live else ""
-    # Format maturity date nicely (e.g. "2054-07-31" -> "July 2054")
-    try:
-        mat_dt = datetime.strptime(raw_maturity, "%Y-%m-%d")
-        bond_maturity = mat_dt.strftime("%B %Y")
-    except (ValueError, TypeError):
-        bond_maturity = raw_maturity
+    .summary-callout .sc-icon {
+        display: none;
+    }
 
-    # Header subtitle
-    if has_live:
-        header_subtitle = "Benchmark Bond Yield &middot; Live Market Data"
-    else:
-        header_subtitle = f"Nominal Zero Coupon &middot; Series {SERIES_CODE} &middot; Bank of England"
 
+    .container {
+        padding: 20px 16px;
+    }
+
+    .stats-grid {
+        grid-template-columns: 1fr 1fr;
+        gap: 10px;
+    }
+
+    .stat-card {
+        padding: 14px;
+    }
+
+    .stat-value {
+        font-size: 20px;
+    }
+
+    .chart-container {
+        padding: 16px;
+    }
+
+    .chart-header {
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 10px;
+        margin-bottom: 14px;
+    }
+
+    .chart-title {
+        font-size: 14px;
+    }
+
+    .chart-wrapper, .value-chart-wrapper {
+        height: 260px;
+    }
+
+    .timeframe-btns {
+        gap: 4px;
+    }
+
+    .tf-btn {
+        padding: 5px 11px;
+        font-size: 11px;
+    }
+
+    .trend-summary {
+        padding: 12px 16px;
+        font-size: 13px;
+        margin: 0 0 20px 0;
+    }
+
+    .calculator {
+        padding: 18px;
+    }
+
+    .calculator h3 {
+        font-size: 15px;
+    }
+
+    .calc-subtitle {
+        font-size: 12px;
+    }
+
+    .calc-results-content {
+        padding: 16px;
+    }
+
+    .calc-base-val {
+        padding: 14px;
+    }
+
+    .cbv-value {
+        font-size: 24px;
+    }
+
+    .calc-scenario-table {
+        font-size: 12px;
+    }
+
+    .calc-scenario-table th,
+    .calc-scenario-table td {
+        padding: 6px 8px;
+    }
+
+    .data-note {
+        padding: 12px 14px;
+        font-size: 10px;
+    }
+
+    .footer {
+        padding: 18px 16px;
+        font-size: 11px;
+    }
+}
+"""
 
-    html = f"""<!DOCTYPE html>
+# Static page head; its only field is the stylesheet href, filled in at import.
+DASHBOARD_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -408,902 +1389,53 @@ def generate_dashboard(data_points, stats, live_data=None):
     <title>UK 30-Year Gilt Yield &mdash; Fairhurst Buckley</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.7/dist/chart.umd.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Century Gothic', CenturyGothic, Nunito, sans-serif;
-            background: #ffffff;
-            color: #32373c;
-            min-height: 100vh;
-        }}
-
-        /* ── Header ── */
-        .header {{
-            background: #ffffff;
-            border-bottom: 3px solid #7ebc3b;
-            padding: 20px 40px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            flex-wrap: wrap;
-            gap: 16px;
-        }}
-
-        .header-left {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-        }}
-
-        .header-title h1 {{
-            font-size: 22px;
-            font-weight: 700;
-            color: #32373c;
-        }}
-
-        .header-title p {{
-            font-size: 13px;
-            color: #6b7280;
-            margin-top: 2px;
-        }}
-
-        .header-right {{
-            display: flex;
-            align-items: center;
-            gap: 24px;
-        }}
-
-        .header-meta {{
-            text-align: right;
-            font-size: 12px;
-            color: #6b7280;
-        }}
-
-        .header-logo img {{
-            height: 48px;
-            width: auto;
-        }}
-
-        /* ── Yield Hero ── */
-        .yield-hero {{
-            background: #f9fafb;
-            border-bottom: 1px solid #e5e7eb;
-            padding: 32px 40px;
-            display: flex;
-            align-items: flex-end;
-            gap: 32px;
-            flex-wrap: wrap;
-        }}
-
-        .yield-current {{
-            display: flex;
-            align-items: baseline;
-            gap: 8px;
-            flex-wrap: wrap;
-        }}
-
-        .yield-value {{
-            font-size: 56px;
-            font-weight: 700;
-            color: #32373c;
-            letter-spacing: -2px;
-            line-height: 1;
-        }}
-
-        .yield-unit {{
-            font-size: 24px;
-            color: #6b7280;
-            font-weight: 400;
-        }}
-
-        .yield-time {{
-            width: 100%;
-            font-size: 12px;
-            color: #9ca3af;
-            font-weight: 400;
-            letter-spacing: 0;
-            margin-top: 2px;
-        }}
-
-        .yield-change {{
-            display: flex;
-            flex-direction: column;
-            gap: 4px;
-            padding-bottom: 6px;
-        }}
-
-        .change-badge {{
-            display: inline-flex;
-            align-items: center;
-            gap: 4px;
-            padding: 4px 12px;
-            border-radius: 9999px;
-            font-size: 13px;
-            font-weight: 700;
-        }}
-
-        .change-badge.positive {{
-            background: rgba(126, 188, 59, 0.12);
-            color: #5a9a1f;
-        }}
-
-        .change-badge.negative {{
-            background: rgba(220, 38, 38, 0.08);
-            color: #dc2626;
-        }}
-
-        .change-label {{
-            font-size: 11px;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-
-        /* ── Summary Callout ── */
-        .summary-callout {{
-            background: #f0f9eb;
-            border-bottom: 1px solid #c8e6a5;
-            padding: 16px 40px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            font-size: 14px;
-            color: #32373c;
-            line-height: 1.5;
-        }}
-
-        .summary-callout .sc-icon {{
-            font-size: 20px;
-            flex-shrink: 0;
-        }}
-
-        .summary-callout strong {{
-            color: #32373c;
-        }}
-
-        .summary-callout .sc-highlight {{
-            font-weight: 700;
-            color: #7ebc3b;
-        }}
-
-
-        /* ── Container ── */
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 28px 40px;
-        }}
-
-        /* ── Stat Cards ── */
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 16px;
-            margin-bottom: 28px;
-        }}
-
-        .stat-card {{
-            background: #ffffff;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 20px;
-            transition: box-shadow 0.2s;
-        }}
-
-        .stat-card:hover {{
-            box-shadow: 0 2px 8px rgba(0,0,0,0.06);
-        }}
-
-        .stat-label {{
-            font-size: 11px;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }}
-
-        .stat-value {{
-            font-size: 24px;
-            font-weight: 700;
-            color: #32373c;
-        }}
-
-        .stat-sub {{
-            font-size: 12px;
-            color: #9ca3af;
-            margin-top: 4px;
-        }}
-
-        .stat-value.positive {{ color: #5a9a1f; }}
-        .stat-value.negative {{ color: #dc2626; }}
-
-        /* ── Chart ── */
-        .chart-container {{
-            background: #ffffff;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 24px;
-            margin-bottom: 28px;
-        }}
-
-        .chart-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            flex-wrap: wrap;
-            gap: 12px;
-        }}
-
-        .timeframe-btns {{
-            display: flex;
-            gap: 6px;
-        }}
-
-        .tf-btn {{
-            padding: 5px 14px;
-            border-radius: 6px;
-            border: 1px solid #e5e7eb;
-            background: #fff;
-            color: #6b7280;
-            font-size: 12px;
-            font-weight: 600;
-            cursor: pointer;
-            font-family: inherit;
-            transition: all 0.15s;
-        }}
-
-        .tf-btn:hover {{
-            border-color: #7ebc3b;
-            color: #7ebc3b;
-        }}
-
-        .tf-btn.active {{
-            background: #7ebc3b;
-            color: #fff;
-            border-color: #7ebc3b;
-        }}
-
-        .chart-title {{
-            font-size: 16px;
-            font-weight: 700;
-            color: #32373c;
-        }}
-
-        .chart-subtitle {{
-            font-size: 13px;
-            color: #6b7280;
-        }}
-
-        .chart-wrapper {{
-            position: relative;
-            height: 450px;
-        }}
-
-        /* ── Trend Summary ── */
-        .trend-summary {{
-            background: #f9fafb;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 16px 22px;
-            margin-bottom: 28px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            font-size: 14px;
-            color: #32373c;
-            line-height: 1.5;
-        }}
-
-        .trend-summary .trend-icon {{
-            font-size: 22px;
-            flex-shrink: 0;
-        }}
-
-        .trend-summary .trend-direction {{
-            font-weight: 700;
-        }}
-
-        .trend-summary .trend-favourable {{
-            color: #5a9a1f;
-        }}
-
-        .trend-summary .trend-adverse {{
-            color: #dc2626;
-        }}
-
-        .trend-summary .trend-bps {{
-            font-weight: 700;
-            color: #6b7280;
-        }}
-
-        /* ── Implied Value Chart ── */
-        .value-chart-container {{
-            background: #ffffff;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            max-height: 0;
-            overflow: hidden;
-            opacity: 0;
-            transition: max-height 0.5s ease, opacity 0.4s ease, padding 0.5s ease, margin 0.5s ease;
-            padding: 0 24px;
-            margin-bottom: 0;
-        }}
-
-        .value-chart-container.visible {{
-            max-height: 600px;
-            opacity: 1;
-            padding: 24px;
-            margin-bottom: 28px;
-        }}
-
-        .value-chart-wrapper {{
-            position: relative;
-            height: 400px;
-        }}
-
-        /* ── Property Context ── */
-        .context-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 28px;
-        }}
-
-        .context-card {{
-            background: #ffffff;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 24px;
-        }}
-
-        .context-card h3 {{
-            font-size: 15px;
-            font-weight: 700;
-            color: #32373c;
-            margin-bottom: 14px;
-            padding-bottom: 12px;
-            border-bottom: 2px solid #7ebc3b;
-        }}
-
-        .context-body {{
-            font-size: 14px;
-            color: #4b5563;
-            line-height: 1.7;
-        }}
-
-        .context-body strong {{
-            color: #32373c;
-        }}
-
-        .context-highlight {{
-            background: #f0f9eb;
-            border-left: 4px solid #7ebc3b;
-            border-radius: 0 8px 8px 0;
-            padding: 14px 18px;
-            margin-top: 14px;
-            font-size: 13px;
-            color: #32373c;
-            line-height: 1.6;
-        }}
-
-
-        /* ── Property Calculator ── */
-        .calculator {{
-            background: #ffffff;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 28px;
-            margin-bottom: 28px;
-        }}
-
-        .calculator h3 {{
-            font-size: 17px;
-            font-weight: 700;
-            color: #32373c;
-            margin-bottom: 6px;
-        }}
-
-        .calculator .calc-subtitle {{
-            font-size: 13px;
-            color: #6b7280;
-            margin-bottom: 24px;
-        }}
-
-        .calc-layout {{
-            display: grid;
-            grid-template-columns: 300px 1fr;
-            gap: 32px;
-            align-items: start;
-        }}
-
-        .calc-inputs {{
-            display: flex;
-            flex-direction: column;
-            gap: 16px;
-        }}
-
-        .calc-field label {{
-            display: block;
-            font-size: 11px;
-            font-weight: 700;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 6px;
-        }}
-
-        .calc-field .input-wrap {{
-            position: relative;
-        }}
-
-        .calc-field .input-wrap .prefix,
-        .calc-field .input-wrap .suffix {{
-            position: absolute;
-            top: 50%;
-            transform: translateY(-50%);
-            font-size: 14px;
-            color: #9ca3af;
-            pointer-events: none;
-        }}
-
-        .calc-field .input-wrap .prefix {{
-            left: 14px;
-        }}
-
-        .calc-field .input-wrap .suffix {{
-            right: 14px;
-        }}
-
-        .calc-field input {{
-            width: 100%;
-            padding: 10px 14px;
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            font-family: 'Century Gothic', CenturyGothic, Nunito, sans-serif;
-            font-size: 15px;
-            font-weight: 700;
-            color: #32373c;
-            background: #f9fafb;
-            transition: border-color 0.2s;
-        }}
-
-        .calc-field input:focus {{
-            outline: none;
-            border-color: #7ebc3b;
-            box-shadow: 0 0 0 3px rgba(126, 188, 59, 0.15);
-        }}
-
-        .calc-field input.has-prefix {{
-            padding-left: 28px;
-        }}
-
-        .calc-field input.has-suffix {{
-            padding-right: 32px;
-        }}
-
-        .calc-toggle-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 6px;
-        }}
-
-        .calc-toggle-row label {{
-            margin-bottom: 0;
-        }}
-
-        .calc-toggle {{
-            display: flex;
-            gap: 2px;
-            background: #f3f4f6;
-            border-radius: 6px;
-            padding: 2px;
-        }}
-
-        .ct-btn {{
-            padding: 3px 10px;
-            border: none;
-            border-radius: 5px;
-            background: transparent;
-            color: #6b7280;
-            font-size: 11px;
-            font-weight: 600;
-            cursor: pointer;
-            font-family: inherit;
-            transition: all 0.15s;
-        }}
-
-        .ct-btn.active {{
-            background: #7ebc3b;
-            color: #fff;
-        }}
-
-        .calc-derived {{
-            font-size: 12px;
-            color: #7ebc3b;
-            font-weight: 600;
-            margin-top: 6px;
-        }}
-
-        .calc-slider {{
-            margin-top: 4px;
-        }}
-
-        .calc-slider label {{
-            display: block;
-            font-size: 11px;
-            font-weight: 700;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }}
-
-        .calc-slider input[type="range"] {{
-            -webkit-appearance: none;
-            appearance: none;
-            width: 100%;
-            height: 6px;
-            border-radius: 3px;
-            background: #e5e7eb;
-            outline: none;
-            cursor: pointer;
-        }}
-
-        .calc-slider input[type="range"]::-webkit-slider-thumb {{
-            -webkit-appearance: none;
-            appearance: none;
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            background: #7ebc3b;
-            border: 2px solid #ffffff;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.15);
-            cursor: pointer;
-        }}
-
-        .calc-slider input[type="range"]::-moz-range-thumb {{
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            background: #7ebc3b;
-            border: 2px solid #ffffff;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.15);
-            cursor: pointer;
-        }}
-
-        .calc-slider .slider-value {{
-            display: flex;
-            justify-content: space-between;
-            align-items: baseline;
-            margin-top: 8px;
-        }}
-
-        .calc-slider .slider-pct {{
-            font-size: 22px;
-            font-weight: 700;
-            color: #7ebc3b;
-        }}
-
-        .calc-slider .slider-desc {{
-            font-size: 12px;
-            color: #9ca3af;
-            text-align: right;
-        }}
-
-        .calc-results {{
-            min-height: 100%;
-        }}
-
-        .calc-results-placeholder {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            min-height: 200px;
-            color: #9ca3af;
-            font-size: 14px;
-            text-align: center;
-            border: 2px dashed #e5e7eb;
-            border-radius: 10px;
-            padding: 24px;
-        }}
-
-        .calc-results-content {{
-            display: none;
-        }}
-
-        .calc-results-content.visible {{
-            display: block;
-        }}
-
-        .calc-base-val {{
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            background: #f9fafb;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 18px 22px;
-            margin-bottom: 18px;
-        }}
-
-        .calc-base-val .cbv-value {{
-            font-size: 28px;
-            font-weight: 700;
-            color: #32373c;
-            white-space: nowrap;
-        }}
-
-        .calc-base-val .cbv-label {{
-            font-size: 13px;
-            color: #6b7280;
-            line-height: 1.4;
-        }}
-
-        .calc-scenario-table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 13px;
-        }}
-
-        .calc-scenario-table th {{
-            text-align: left;
-            color: #6b7280;
-            font-weight: 700;
-            padding: 8px 12px;
-            border-bottom: 2px solid #e5e7eb;
-            font-size: 11px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-
-        .calc-scenario-table td {{
-            padding: 9px 12px;
-            color: #4b5563;
-            border-bottom: 1px solid #f3f4f6;
-        }}
-
-        .calc-scenario-table tr.scenario-current td {{
-            color: #32373c;
-            font-weight: 700;
-            background: #f0f9eb;
-        }}
-
-        .calc-scenario-table td.val-positive {{
-            color: #5a9a1f;
-            font-weight: 700;
-        }}
-
-        .calc-scenario-table td.val-negative {{
-            color: #dc2626;
-            font-weight: 700;
-        }}
-
-        @media (max-width: 900px) {{
-            .calc-layout {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-
-        /* ── Footer ── */
-        .footer {{
-            text-align: center;
-            padding: 24px 40px;
-            font-size: 12px;
-            color: #9ca3af;
-            border-top: 1px solid #e5e7eb;
-        }}
-
-        .footer a {{
-            color: #7ebc3b;
-            text-decoration: none;
-        }}
-
-        /* ── Data Note ── */
-        .data-note {{
-            background: #f9fafb;
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 16px 20px;
-            margin-bottom: 28px;
-            font-size: 11px;
-            color: #6b7280;
-            line-height: 1.6;
-        }}
-
-        .data-note h4 {{
-            font-size: 11px;
-            font-weight: 700;
-            color: #32373c;
-            margin-bottom: 6px;
-        }}
-
-        .data-note p {{
-            margin-bottom: 8px;
-        }}
-
-        .data-note p:last-child {{
-            margin-bottom: 0;
-        }}
-
-        /* ── Responsive ── */
-        @media (max-width: 900px) {{
-            .context-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-
-        @media (max-width: 768px) {{
-            .header {{
-                padding: 10px 16px;
-                flex-wrap: nowrap;
-            }}
-
-            .header-left {{
-                gap: 10px;
-                flex: 1;
-                min-width: 0;
-            }}
-
-            .header-title h1 {{
-                font-size: 14px;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-            }}
-
-            .header-title p {{
-                font-size: 10px;
-                display: none;
-            }}
-
-            .header-right {{
-                flex-direction: row-reverse;
-                align-items: center;
-                gap: 10px;
-                flex-shrink: 0;
-            }}
-
-            .header-meta {{
-                display: none;
-            }}
-
-            .header-logo img {{
-                height: 28px;
-            }}
-
-            .yield-hero {{
-                padding: 20px 16px;
-                gap: 16px;
-            }}
-
-            .yield-value {{
-                font-size: 40px;
-            }}
-
-            .yield-change {{
-                padding-bottom: 0;
-            }}
-
-            .change-badge {{
-                font-size: 12px;
-                padding: 3px 10px;
-            }}
-
-            .summary-callout {{
-                padding: 12px 16px;
-                font-size: 12px;
-                line-height: 1.6;
-            }}
-
-            .summary-callout .sc-icon {{
-                display: none;
-            }}
-
-
-            .container {{
-                padding: 20px 16px;
-            }}
-
-            .stats-grid {{
-                grid-template-columns: 1fr 1fr;
-                gap: 10px;
-            }}
-
-            .stat-card {{
-                padding: 14px;
-            }}
-
-            .stat-value {{
-                font-size: 20px;
-            }}
-
-            .chart-container {{
-                padding: 16px;
-            }}
-
-            .chart-header {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 10px;
-                margin-bottom: 14px;
-            }}
-
-            .chart-title {{
-                font-size: 14px;
-            }}
-
-            .chart-wrapper, .value-chart-wrapper {{
-                height: 260px;
-            }}
-
-            .timeframe-btns {{
-                gap: 4px;
-            }}
-
-            .tf-btn {{
-                padding: 5px 11px;
-                font-size: 11px;
-            }}
-
-            .trend-summary {{
-                padding: 12px 16px;
-                font-size: 13px;
-                margin: 0 0 20px 0;
-            }}
-
-            .calculator {{
-                padding: 18px;
-            }}
-
-            .calculator h3 {{
-                font-size: 15px;
-            }}
-
-            .calc-subtitle {{
-                font-size: 12px;
-            }}
-
-            .calc-results-content {{
-                padding: 16px;
-            }}
-
-            .calc-base-val {{
-                padding: 14px;
-            }}
-
-            .cbv-value {{
-                font-size: 24px;
-            }}
-
-            .calc-scenario-table {{
-                font-size: 12px;
-            }}
-
-            .calc-scenario-table th,
-            .calc-scenario-table td {{
-                padding: 6px 8px;
-            }}
-
-            .data-note {{
-                padding: 12px 14px;
-                font-size: 10px;
-            }}
-
-            .footer {{
-                padding: 18px 16px;
-                font-size: 11px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_href}">
 </head>
-<body>
+"""
+
+# Optional body fragments: substituted whole into the body template, or "" when absent
+LOGO_FRAGMENT = '<div class="header-logo"><img src="{}" alt="Fairhurst Buckley"></div>'
+LIVE_TIME_FRAGMENT = '<span class="yield-time">{}</span>'
+BOND_DETAILS_FRAGMENT = "({} coupon, maturing {})"
+CHANGE_BADGE_FRAGMENT = """        <div class="yield-change">
+            <span class="change-label">{}</span>
+            <span class="change-badge {}">{}</span>
+        </div>"""
+
+
+TREND_SUMMARY_FRAGMENT = (
+    '        <div class="trend-summary" id="trendSummary">'
+    '<span class="trend-icon {css}">{icon}</span>'
+    '<span>30-day trend: Yields <span class="trend-direction {css}">{direction}</span> '
+    '&mdash; current yield is <span class="trend-bps">{bps:.0f}bps</span> '
+    '{side} the 30-day moving average. <em>{commentary}.</em></span></div>'
+)
+
+
+def _trend_summary_html(chart_yields, window=30):
+    """Trend callout comparing the latest yield with its 30-day SMA; "" until a full window exists."""
+    if len(chart_yields) < window:
+        return ""
+    diff = chart_yields[-1] - sum(chart_yields[-window:]) / window
+    falling = diff < 0
+    return TREND_SUMMARY_FRAGMENT.format(
+        css="trend-favourable" if falling else "trend-adverse",
+        icon="&#9660;" if falling else "&#9650;",
+        direction="falling" if falling else "rising",
+        bps=abs(diff * 100),
+        side="below" if falling else "above",
+        commentary="favourable conditions for property values" if falling else "headwind for property values",
+    )
+
+
+@lru_cache(maxsize=2)
+def _logo_html(logo_data_uri):
+    """Header logo markup; cached because the embedded data URI is large and the same every render."""
+    return LOGO_FRAGMENT.format(logo_data_uri) if logo_data_uri else ""
+
+
+# Per-render page body, filled in by generate_dashboard() via str.format_map
+DASHBOARD_BODY_TEMPLATE = """<body>
     <div class="header">
         <div class="header-left">
             <div class="header-title">
@@ -1316,7 +1448,7 @@ def generate_dashboard(data_points, stats, live_data=None):
                 Last updated: {updated_time}<br>
                 {data_freshness}
             </div>
-            {'<div class="header-logo"><img src="' + logo_data_uri + '" alt="Fairhurst Buckley"></div>' if logo_data_uri else ''}
+            {logo_html}
         </div>
     </div>
 
@@ -1324,29 +1456,14 @@ def generate_dashboard(data_points, stats, live_data=None):
         <div class="yield-current">
             <span class="yield-value">{current_yield:.2f}</span>
             <span class="yield-unit">%</span>
-            {'<span class="yield-time">' + live_time_short + '</span>' if live_time_short else ''}
-        </div>
-        <div class="yield-change">
-            <span class="change-label">Daily Change</span>
-            <span class="change-badge {daily_css}">{daily_str}</span>
-        </div>
-        <div class="yield-change">
-            <span class="change-label">Weekly</span>
-            <span class="change-badge {week_css}">{week_str}</span>
-        </div>
-        <div class="yield-change">
-            <span class="change-label">Monthly</span>
-            <span class="change-badge {month_css}">{month_str}</span>
-        </div>
-        <div class="yield-change">
-            <span class="change-label">YTD</span>
-            <span class="change-badge {ytd_css}">{ytd_str}</span>
+            {live_time_html}
         </div>
+{change_badges_html}
     </div>
 
     <div class="summary-callout">
         <span class="sc-icon">&#9432;</span>
-        <span>Over the past month, gilt yields have <strong>{yield_direction} by {abs(month_change):.3f}%</strong> ({month_bps:.0f}bps), {borrowing_verb} the implied cost of long-term property debt.</span>
+        <span>Over the past month, gilt yields have <strong>{yield_direction} by {month_change_abs:.3f}%</strong> ({month_bps:.0f}bps), {borrowing_verb} the implied cost of long-term property debt.</span>
     </div>
 
 
@@ -1364,13 +1481,13 @@ def generate_dashboard(data_points, stats, live_data=None):
             </div>
             <div class="stat-card">
                 <div class="stat-label">52-Week Range</div>
-                <div class="stat-value">{high_12m - low_12m:.2f}%</div>
+                <div class="stat-value">{range_12m:.2f}%</div>
                 <div class="stat-sub">High to Low spread</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Implied Borrowing Cost</div>
                 <div class="stat-value">{implied_borrowing:.2f}%</div>
-                <div class="stat-sub">Gilt + {PROPERTY_LENDING_SPREAD_BPS}bps lending margin</div>
+                <div class="stat-sub">Gilt + {lending_spread_bps}bps lending margin</div>
             </div>
         </div>
 
@@ -1378,7 +1495,7 @@ def generate_dashboard(data_points, stats, live_data=None):
             <div class="chart-header">
                 <div>
                     <div class="chart-title" id="yieldChartTitle">Yield History &mdash; Last Twelve Months</div>
-                    <div class="chart-subtitle">{'Adjusted to benchmark level (+' + f'{spread:.2f}' + '% spread applied to BoE yield curve)' if spread_ok else 'Daily nominal zero coupon 30-year gilt yield (%)'}</div>
+                    <div class="chart-subtitle">{chart_subtitle}</div>
                 </div>
                 <div class="timeframe-btns">
                     <button class="tf-btn" data-months="1">1M</button>
@@ -1392,7 +1509,7 @@ def generate_dashboard(data_points, stats, live_data=None):
             </div>
         </div>
 
-        <div class="trend-summary" id="trendSummary"></div>
+{trend_summary_html}
 
         <div class="value-chart-container" id="valueChartContainer">
             <div class="chart-header">
@@ -1451,7 +1568,7 @@ def generate_dashboard(data_points, stats, live_data=None):
                     </div>
                 </div>
                 <div class="calc-results">
-                    <div class="calc-results-placeholder" id="calcPlaceholder">
+                    <div class="calc-results-placeholder visible" id="calcPlaceholder">
                         Enter the annual rent and property yield<br>to see valuation scenarios
                     </div>
                     <div class="calc-results-content" id="calcContent">
@@ -1481,7 +1598,7 @@ def generate_dashboard(data_points, stats, live_data=None):
             <h4>About this data</h4>
             <p>
                 The headline yield is the <strong>benchmark 30-year gilt bond yield</strong>
-                {'(' + bond_coupon + ' coupon, maturing ' + bond_maturity + ')' if bond_coupon and bond_maturity else ''}
+                {bond_details}
                 &mdash; the same figure quoted by the Financial Times and Bloomberg.
                 It is sourced live during UK market hours and updates each time this page is refreshed.
             </p>
@@ -1499,27 +1616,47 @@ def generate_dashboard(data_points, stats, live_data=None):
         &middot; Prepared for Fairhurst Buckley
     </div>
 
-    <script>
-        const dates = {dates_json};
-        const yields = {yields_json};
-
-        // Compute 30-day Simple Moving Average
-        function computeSMA(data, window) {{
-            const sma = [];
-            for (let i = 0; i < data.length; i++) {{
-                if (i < window - 1) {{
-                    sma.push(null);
-                }} else {{
-                    let sum = 0;
-                    for (let j = i - window + 1; j <= i; j++) {{
-                        sum += data[j];
-                    }}
-                    sma.push(sum / window);
-                }}
-            }}
-            return sma;
-        }}
-        const yieldSMA30 = computeSMA(yields, 30);
+    <script id="data" type="application/json">{payload_json}</script>
+
+"""
+
+# Static chart and calculator scripts; they read the JSON payload at the end of the body.
+DASHBOARD_SCRIPTS = """    <script>
+        // Per-render data: packed chart series, tooltip labels, timeframe offsets, live yield
+        const pageData = JSON.parse(document.getElementById('data').textContent);
+        const packedSeries = pageData.series;
+        const labelsPretty = pageData.labels;
+        const windowOffsets = pageData.windowOffsets;
+        const CURRENT_GILT = pageData.currentGilt;
+
+        // Decode a base64 little-endian typed array shipped by the Python renderer
+        function unpack(b64, TypedArray) {
+            const bin = atob(b64);
+            const bytes = new Uint8Array(bin.length);
+            for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+            return new TypedArray(bytes.buffer);
+        }
+
+        // Dates become local-midnight timestamps for the time scale; yields stay typed
+        const dates = Array.from(unpack(packedSeries.days, Int32Array), function(d) {
+            return new Date(packedSeries.base[0], packedSeries.base[1] - 1, packedSeries.base[2] + d).getTime();
+        });
+        const yields = unpack(packedSeries.yields, Float32Array);
+        const yieldSMA30 = unpack(packedSeries.sma, Float32Array);
+
+        // Chart points in Chart.js's internal {x, y} form, so datasets skip parsing
+        function toPoints(values) {
+            const points = new Array(values.length);
+            for (let i = 0; i < values.length; i++) {
+                points[i] = { x: dates[i], y: values[i] };
+            }
+            return points;
+        }
+        const yieldPoints = toPoints(yields);
+        const yieldSMAPoints = toPoints(yieldSMA30);
+
+        // Index of the first point shown for the selected timeframe (0 = full year)
+        let viewOffset = 0;
 
         const ctx = document.getElementById('yieldChart').getContext('2d');
 
@@ -1528,13 +1665,12 @@ def generate_dashboard(data_points, stats, live_data=None):
         gradient.addColorStop(0, 'rgba(126, 188, 59, 0.18)');
         gradient.addColorStop(1, 'rgba(126, 188, 59, 0.0)');
 
-        const yieldChart = new Chart(ctx, {{
+        const yieldChart = new Chart(ctx, {
             type: 'line',
-            data: {{
-                labels: dates,
-                datasets: [{{
+            data: {
+                datasets: [{
                     label: '30-Year Gilt Yield (%)',
-                    data: yields,
+                    data: yieldPoints,
                     borderColor: '#7ebc3b',
                     backgroundColor: gradient,
                     borderWidth: 2.5,
@@ -1545,9 +1681,9 @@ def generate_dashboard(data_points, stats, live_data=None):
                     pointHoverBackgroundColor: '#7ebc3b',
                     pointHoverBorderColor: '#ffffff',
                     pointHoverBorderWidth: 2,
-                }}, {{
+                }, {
                     label: '30-Day Moving Average (%)',
-                    data: yieldSMA30,
+                    data: yieldSMAPoints,
                     borderColor: 'rgba(126, 188, 59, 0.5)',
                     backgroundColor: 'transparent',
                     borderWidth: 2,
@@ -1560,20 +1696,28 @@ def generate_dashboard(data_points, stats, live_data=None):
                     pointHoverBorderColor: '#ffffff',
                     pointHoverBorderWidth: 2,
                     spanGaps: false,
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                interaction: {{
+                parsing: false,
+                normalized: true,
+                animation: false,
+                animations: {
+                    colors: false,
+                    x: false,
+                    y: false,
+                },
+                interaction: {
                     intersect: false,
                     mode: 'index',
-                }},
-                plugins: {{
-                    legend: {{
+                },
+                plugins: {
+                    legend: {
                         display: false,
-                    }},
-                    tooltip: {{
+                    },
+                    tooltip: {
                         backgroundColor: '#32373c',
                         titleColor: '#ffffff',
                         bodyColor: '#e5e7eb',
@@ -1582,126 +1726,91 @@ def generate_dashboard(data_points, stats, live_data=None):
                         padding: 12,
                         cornerRadius: 8,
                         displayColors: true,
-                        titleFont: {{ family: "'Century Gothic', CenturyGothic, Nunito, sans-serif", weight: '700' }},
-                        bodyFont: {{ family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
-                        callbacks: {{
-                            title: function(items) {{
-                                const dateStr = dates[items[0].dataIndex];
-                                const parts = dateStr.split('-');
-                                const d = new Date(parts[0], parts[1] - 1, parts[2]);
-                                return d.toLocaleDateString('en-GB', {{ day: 'numeric', month: 'long', year: 'numeric' }});
-                            }},
-                            label: function(item) {{
+                        titleFont: { family: "'Century Gothic', CenturyGothic, Nunito, sans-serif", weight: '700' },
+                        bodyFont: { family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
+                        callbacks: {
+                            title: function(items) {
+                                return labelsPretty[viewOffset + items[0].dataIndex];
+                            },
+                            label: function(item) {
                                 if (item.parsed.y === null || item.parsed.y === undefined) return null;
-                                if (item.datasetIndex === 0) {{
+                                if (item.datasetIndex === 0) {
                                     return 'Yield: ' + item.parsed.y.toFixed(4) + '%';
-                                }} else {{
+                                } else {
                                     return '30d MA: ' + item.parsed.y.toFixed(4) + '%';
-                                }}
-                            }},
-                            filter: function(item) {{
+                                }
+                            },
+                            filter: function(item) {
                                 return item.parsed.y !== null && item.parsed.y !== undefined;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    x: {{
+                            }
+                        }
+                    }
+                },
+                scales: {
+                    x: {
                         type: 'time',
-                        time: {{
+                        time: {
                             unit: 'month',
-                            displayFormats: {{
+                            displayFormats: {
                                 month: 'MMM yyyy'
-                            }}
-                        }},
-                        grid: {{
+                            }
+                        },
+                        grid: {
                             color: '#f3f4f6',
-                        }},
-                        ticks: {{
+                        },
+                        ticks: {
                             color: '#6b7280',
-                            font: {{ size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
+                            font: { size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
                             maxRotation: 0,
-                        }},
-                        border: {{
+                        },
+                        border: {
                             color: '#e5e7eb',
-                        }}
-                    }},
-                    y: {{
-                        grid: {{
+                        }
+                    },
+                    y: {
+                        grid: {
                             color: '#f3f4f6',
-                        }},
-                        ticks: {{
+                        },
+                        ticks: {
                             color: '#6b7280',
-                            font: {{ size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
-                            callback: function(value) {{
+                            font: { size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
+                            callback: function(value) {
                                 return value.toFixed(2) + '%';
-                            }}
-                        }},
-                        border: {{
+                            }
+                        },
+                        border: {
                             color: '#e5e7eb',
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Populate trend summary
-        (function() {{
-            const lastYield = yields[yields.length - 1];
-            const lastSMA = yieldSMA30[yieldSMA30.length - 1];
-            const el = document.getElementById('trendSummary');
-
-            if (lastSMA === null || lastSMA === undefined) {{
-                el.style.display = 'none';
-                return;
-            }}
-
-            const diff = lastYield - lastSMA;
-            const diffBps = Math.abs(diff * 100).toFixed(0);
-            const falling = diff < 0;
-
-            const icon = falling ? '&#9660;' : '&#9650;';
-            const dirClass = falling ? 'trend-favourable' : 'trend-adverse';
-            const dirWord = falling ? 'falling' : 'rising';
-            const commentary = falling
-                ? 'favourable conditions for property values'
-                : 'headwind for property values';
-
-            el.innerHTML =
-                '<span class="trend-icon ' + dirClass + '">' + icon + '</span>' +
-                '<span>30-day trend: Yields <span class="trend-direction ' + dirClass + '">' + dirWord + '</span> ' +
-                '&mdash; current yield is <span class="trend-bps">' + diffBps + 'bps</span> ' +
-                (falling ? 'below' : 'above') + ' the 30-day moving average. ' +
-                '<em>' + commentary + '.</em></span>';
-        }})();
-
-        // Time frame selector
-        document.querySelectorAll('.tf-btn').forEach(function(btn) {{
-            btn.addEventListener('click', function() {{
-                document.querySelectorAll('.tf-btn').forEach(function(b) {{ b.classList.remove('active'); }});
+                        }
+                    }
+                }
+            }
+        });
+
+        // Time frame selector: swap in the visible slice of each series rather than
+        // clipping the full year with x.min
+        document.querySelectorAll('.tf-btn').forEach(function(btn) {
+            btn.addEventListener('click', function() {
+                document.querySelectorAll('.tf-btn').forEach(function(b) { b.classList.remove('active'); });
                 this.classList.add('active');
                 const months = parseInt(this.dataset.months);
-                const cutoff = new Date();
-                cutoff.setMonth(cutoff.getMonth() - months);
-                const minDate = cutoff.toISOString().split('T')[0];
+                viewOffset = windowOffsets[months];
 
-                yieldChart.options.scales.x.min = minDate;
-                yieldChart.update();
+                yieldChart.data.datasets[0].data = yieldPoints.slice(viewOffset);
+                yieldChart.data.datasets[1].data = yieldSMAPoints.slice(viewOffset);
+                yieldChart.update('none');
 
-                if (typeof valueChartInstance !== 'undefined' && valueChartInstance) {{
-                    valueChartInstance.options.scales.x.min = minDate;
-                    valueChartInstance.update();
-                }}
+                if (typeof valueChartInstance !== 'undefined' && valueChartInstance) {
+                    showValueWindow();
+                }
 
-                const titles = {{1:'Last Month', 3:'Last 3 Months', 6:'Last 6 Months', 12:'Last Twelve Months'}};
+                const titles = {1:'Last Month', 3:'Last 3 Months', 6:'Last 6 Months', 12:'Last Twelve Months'};
                 document.getElementById('yieldChartTitle').textContent = 'Yield History \u2014 ' + titles[months];
-            }});
-        }});
+            });
+        });
     </script>
 
     <script>
         // ── Property Valuation Calculator ──
-        const CURRENT_GILT = {current_yield};
         const rentInput = document.getElementById('calcRent');
         const yieldInput = document.getElementById('calcYield');
         const priceInput = document.getElementById('calcPrice');
@@ -1720,94 +1829,126 @@ def generate_dashboard(data_points, stats, live_data=None):
         const yieldFieldLabel = document.getElementById('yieldFieldLabel');
         let inputMode = 'yield';
 
-        function parseNumber(str) {{
-            return parseFloat(str.replace(/[^0-9.]/g, ''));
-        }}
+        // Keep only the digits (and optionally the decimal point) of a field value; a
+        // charCode scan is cheaper than a regex replace on every keystroke
+        function stripToDigits(str, keepPoint) {
+            let out = '';
+            for (let i = 0; i < str.length; i++) {
+                const c = str.charCodeAt(i);
+                if ((c >= 48 && c <= 57) || (keepPoint && c === 46)) {
+                    out += str[i];
+                }
+            }
+            return out;
+        }
+
+        function parseNumber(str) {
+            return parseFloat(stripToDigits(str, true));
+        }
+
+        // One shared formatter; toLocaleString would look up a new Intl.NumberFormat per call
+        const wholeNumber = new Intl.NumberFormat('en-GB', { maximumFractionDigits: 0 });
 
-        function formatGBP(val) {{
-            if (val >= 1e6) {{
+        function formatGBP(val) {
+            if (val >= 1e6) {
                 return '\\u00A3' + (val / 1e6).toFixed(2) + 'm';
-            }}
-            return '\\u00A3' + val.toLocaleString('en-GB', {{ maximumFractionDigits: 0 }});
-        }}
+            }
+            return '\\u00A3' + wholeNumber.format(val);
+        }
 
-        function formatGBPFull(val) {{
-            return '\\u00A3' + val.toLocaleString('en-GB', {{ maximumFractionDigits: 0 }});
-        }}
+        function formatGBPFull(val) {
+            return '\\u00A3' + wholeNumber.format(val);
+        }
 
         // ── Implied Value Chart ──
         let valueChartInstance = null;
         const valueChartContainer = document.getElementById('valueChartContainer');
         const valueChartSubtitle = document.getElementById('valueChartSubtitle');
 
-        function updateValueChart(rent, propYield, passThrough) {{
-            if (!rent || !propYield || rent <= 0 || propYield <= 0) {{
+        // Gilt move of each historical point relative to today; fixed for the page's lifetime
+        const giltDelta = new Float64Array(yields.length);
+        for (let i = 0; i < yields.length; i++) {
+            giltDelta[i] = yields[i] - CURRENT_GILT;
+        }
+
+        // Implied value series behind the chart, allocated once: a typed buffer of the
+        // values plus {x, y} points whose y is rewritten on each recalculation
+        const impliedValues = new Float64Array(giltDelta.length);
+        const valueSeries = {
+            implied: toPoints(impliedValues),
+            sma: toPoints(impliedValues),
+            today: toPoints(impliedValues),
+        };
+        for (let i = 0; i < valueSeries.today.length; i++) {
+            valueSeries.today[i].y = null;
+        }
+
+        // Point the implied value chart at the slice for the selected timeframe
+        function showValueWindow() {
+            valueChartInstance.data.datasets[0].data = valueSeries.implied.slice(viewOffset);
+            valueChartInstance.data.datasets[1].data = valueSeries.sma.slice(viewOffset);
+            valueChartInstance.data.datasets[2].data = valueSeries.today.slice(viewOffset);
+            valueChartInstance.update('none');
+        }
+
+        function updateValueChart(rent, propYield, passThrough) {
+            if (!rent || !propYield || rent <= 0 || propYield <= 0) {
                 valueChartContainer.classList.remove('visible');
                 return;
-            }}
-
-            // Compute implied values for each historical data point
-            const impliedValues = [];
-            for (let i = 0; i < yields.length; i++) {{
-                const giltDelta = yields[i] - CURRENT_GILT;
-                const adjustedYield = propYield + (giltDelta * passThrough);
-                if (adjustedYield <= 0) {{
-                    impliedValues.push(null);
-                }} else {{
-                    impliedValues.push(rent / (adjustedYield / 100));
-                }}
-            }}
-
-            // Compute 30-day SMA of implied values
-            const valueSMA30 = [];
-            for (let i = 0; i < impliedValues.length; i++) {{
-                if (i < 29) {{
-                    valueSMA30.push(null);
-                }} else {{
-                    let sum = 0;
-                    let count = 0;
-                    for (let j = i - 29; j <= i; j++) {{
-                        if (impliedValues[j] !== null) {{
-                            sum += impliedValues[j];
-                            count++;
-                        }}
-                    }}
-                    valueSMA30.push(count > 0 ? sum / count : null);
-                }}
-            }}
+            }
+
+            // Compute implied values for each historical data point (NaN where the
+            // adjusted yield is not positive; Chart.js treats NaN as a gap)
+            const n = giltDelta.length;
+            const implied = valueSeries.implied;
+            const rentHundred = rent * 100;
+            for (let i = 0; i < n; i++) {
+                const adjustedYield = propYield + giltDelta[i] * passThrough;
+                impliedValues[i] = adjustedYield > 0 ? rentHundred / adjustedYield : NaN;
+                implied[i].y = impliedValues[i];
+            }
+
+            // Compute 30-day SMA of implied values (rolling sum/count over valid points)
+            const sma = valueSeries.sma;
+            let sum = 0;
+            let count = 0;
+            for (let i = 0; i < n; i++) {
+                if (!isNaN(impliedValues[i])) {
+                    sum += impliedValues[i];
+                    count++;
+                }
+                if (i >= 30 && !isNaN(impliedValues[i - 30])) {
+                    sum -= impliedValues[i - 30];
+                    count--;
+                }
+                sma[i].y = i < 29 || count === 0 ? null : sum / count;
+            }
 
             // Update subtitle
-            const rentDisplay = '\\u00A3' + rent.toLocaleString('en-GB', {{ maximumFractionDigits: 0 }});
+            const rentDisplay = formatGBPFull(rent);
             const ptPct = Math.round(passThrough * 100);
             valueChartSubtitle.textContent =
                 'Based on ' + rentDisplay + ' rent at ' + propYield.toFixed(2) + '% yield with ' + ptPct + '% gilt pass-through';
 
             valueChartContainer.classList.add('visible');
 
-            if (valueChartInstance) {{
-                valueChartInstance.data.datasets[0].data = impliedValues;
-                valueChartInstance.data.datasets[1].data = valueSMA30;
-                const todayVal = impliedValues[impliedValues.length - 1];
-                valueChartInstance.data.datasets[2].data =
-                    new Array(impliedValues.length - 1).fill(null).concat([todayVal]);
-                valueChartInstance.update('none');
-            }} else {{
+            valueSeries.today[n - 1].y = impliedValues[n - 1];
+
+            if (valueChartInstance) {
+                showValueWindow();
+            } else {
                 const vCtx = document.getElementById('valueChart').getContext('2d');
                 const vGradient = vCtx.createLinearGradient(0, 0, 0, 400);
                 vGradient.addColorStop(0, 'rgba(212, 160, 57, 0.18)');
                 vGradient.addColorStop(1, 'rgba(212, 160, 57, 0.0)');
 
-                const todayVal = impliedValues[impliedValues.length - 1];
-                const todayData = new Array(impliedValues.length - 1).fill(null).concat([todayVal]);
-
-                valueChartInstance = new Chart(vCtx, {{
+                valueChartInstance = new Chart(vCtx, {
                     type: 'line',
-                    data: {{
-                        labels: dates,
+                    data: {
                         datasets: [
-                            {{
+                            {
                                 label: 'Implied Disposal Value',
-                                data: impliedValues,
+                                data: valueSeries.implied.slice(viewOffset),
                                 borderColor: '#d4a039',
                                 backgroundColor: vGradient,
                                 borderWidth: 2.5,
@@ -1819,10 +1960,10 @@ def generate_dashboard(data_points, stats, live_data=None):
                                 pointHoverBorderColor: '#ffffff',
                                 pointHoverBorderWidth: 2,
                                 spanGaps: true,
-                            }},
-                            {{
+                            },
+                            {
                                 label: '30-Day Moving Average',
-                                data: valueSMA30,
+                                data: valueSeries.sma.slice(viewOffset),
                                 borderColor: 'rgba(212, 160, 57, 0.5)',
                                 backgroundColor: 'transparent',
                                 borderWidth: 2,
@@ -1835,10 +1976,10 @@ def generate_dashboard(data_points, stats, live_data=None):
                                 pointHoverBorderColor: '#ffffff',
                                 pointHoverBorderWidth: 2,
                                 spanGaps: false,
-                            }},
-                            {{
+                            },
+                            {
                                 label: "Today's Value",
-                                data: todayData,
+                                data: valueSeries.today.slice(viewOffset),
                                 borderColor: '#d4a039',
                                 backgroundColor: '#d4a039',
                                 pointRadius: 8,
@@ -1848,21 +1989,29 @@ def generate_dashboard(data_points, stats, live_data=None):
                                 pointBorderWidth: 3,
                                 showLine: false,
                                 fill: false,
-                            }}
+                            }
                         ]
-                    }},
-                    options: {{
+                    },
+                    options: {
                         responsive: true,
                         maintainAspectRatio: false,
-                        interaction: {{
+                        parsing: false,
+                        normalized: true,
+                        animation: false,
+                        animations: {
+                            colors: false,
+                            x: false,
+                            y: false,
+                        },
+                        interaction: {
                             intersect: false,
                             mode: 'index',
-                        }},
-                        plugins: {{
-                            legend: {{
+                        },
+                        plugins: {
+                            legend: {
                                 display: false,
-                            }},
-                            tooltip: {{
+                            },
+                            tooltip: {
                                 backgroundColor: '#32373c',
                                 titleColor: '#ffffff',
                                 bodyColor: '#e5e7eb',
@@ -1871,175 +2020,200 @@ def generate_dashboard(data_points, stats, live_data=None):
                                 padding: 12,
                                 cornerRadius: 8,
                                 displayColors: true,
-                                titleFont: {{ family: "'Century Gothic', CenturyGothic, Nunito, sans-serif", weight: '700' }},
-                                bodyFont: {{ family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
-                                callbacks: {{
-                                    title: function(items) {{
-                                        const dateStr = dates[items[0].dataIndex];
-                                        const parts = dateStr.split('-');
-                                        const d = new Date(parts[0], parts[1] - 1, parts[2]);
-                                        return d.toLocaleDateString('en-GB', {{ day: 'numeric', month: 'long', year: 'numeric' }});
-                                    }},
-                                    label: function(item) {{
+                                titleFont: { family: "'Century Gothic', CenturyGothic, Nunito, sans-serif", weight: '700' },
+                                bodyFont: { family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
+                                callbacks: {
+                                    title: function(items) {
+                                        return labelsPretty[viewOffset + items[0].dataIndex];
+                                    },
+                                    label: function(item) {
                                         if (item.parsed.y === null || item.parsed.y === undefined) return null;
                                         const val = item.parsed.y;
-                                        let lbl = item.dataset.label + ': ';
-                                        if (val >= 1e6) {{
-                                            lbl += '\\u00A3' + (val / 1e6).toFixed(2) + 'm';
-                                        }} else {{
-                                            lbl += '\\u00A3' + val.toLocaleString('en-GB', {{ maximumFractionDigits: 0 }});
-                                        }}
-                                        return lbl;
-                                    }},
-                                    filter: function(item) {{
+                                        return item.dataset.label + ': ' + formatGBP(val);
+                                    },
+                                    filter: function(item) {
                                         return item.parsed.y !== null && item.parsed.y !== undefined;
-                                    }}
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            x: {{
+                                    }
+                                }
+                            }
+                        },
+                        scales: {
+                            x: {
                                 type: 'time',
-                                time: {{
+                                time: {
                                     unit: 'month',
-                                    displayFormats: {{
+                                    displayFormats: {
                                         month: 'MMM yyyy'
-                                    }}
-                                }},
-                                grid: {{ color: '#f3f4f6' }},
-                                ticks: {{
+                                    }
+                                },
+                                grid: { color: '#f3f4f6' },
+                                ticks: {
                                     color: '#6b7280',
-                                    font: {{ size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
+                                    font: { size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
                                     maxRotation: 0,
-                                }},
-                                border: {{ color: '#e5e7eb' }}
-                            }},
-                            y: {{
-                                grid: {{ color: '#f3f4f6' }},
-                                ticks: {{
+                                },
+                                border: { color: '#e5e7eb' }
+                            },
+                            y: {
+                                grid: { color: '#f3f4f6' },
+                                ticks: {
                                     color: '#6b7280',
-                                    font: {{ size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" }},
-                                    callback: function(value) {{
-                                        if (value >= 1e6) {{
+                                    font: { size: 11, family: "'Century Gothic', CenturyGothic, Nunito, sans-serif" },
+                                    callback: function(value) {
+                                        if (value >= 1e6) {
                                             return '\\u00A3' + (value / 1e6).toFixed(1) + 'm';
-                                        }}
+                                        }
                                         return '\\u00A3' + (value / 1e3).toFixed(0) + 'k';
-                                    }}
-                                }},
-                                border: {{ color: '#e5e7eb' }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-        }}
-
-        function updateSliderLabel() {{
-            const pt = parseInt(passThroughInput.value);
+                                    }
+                                },
+                                border: { color: '#e5e7eb' }
+                            }
+                        }
+                    }
+                });
+            }
+        }
+
+        // Scenarios: gilt moves from -75bps to +75bps in 25bp steps
+        // Property yield shift = gilt move * pass-through rate
+        const scenarios = [-75, -50, -25, 0, 25, 50, 75];
+
+        // The scenario rows never change shape, so build them once and let
+        // recalculate() rewrite only their text rather than re-parse HTML
+        const scenarioRows = scenarios.map(function(deltaBps) {
+            const tr = document.createElement('tr');
+            const cells = [];
+            for (let i = 0; i < 4; i++) {
+                cells.push(tr.appendChild(document.createElement('td')));
+            }
+            if (deltaBps === 0) {
+                tr.className = 'scenario-current';
+                cells[0].textContent = 'Current';
+                cells[3].textContent = '\\u2014';
+            } else {
+                cells[0].textContent = (deltaBps > 0 ? '+' : '') + deltaBps + 'bps';
+            }
+            return { tr: tr, yieldCell: cells[1], valueCell: cells[2], changeCell: cells[3] };
+        });
+        const scenarioFragment = document.createDocumentFragment();
+        scenarioRows.forEach(function(row) {
+            scenarioFragment.appendChild(row.tr);
+        });
+        tableBody.replaceChildren(scenarioFragment);
+
+        function updateSliderLabel(pt) {
             passPctEl.textContent = pt + '%';
             const exampleShift = Math.round(50 * pt / 100);
             passDescEl.textContent = '50bps gilt move = ' + exampleShift + 'bps yield shift';
-        }}
-
-        function recalculate() {{
-            updateSliderLabel();
+        }
 
+        function recalculate() {
+            // Read every input before touching the DOM, then apply all writes in one
+            // pass, so no write is ever followed by another read within the frame
+            const priceMode = inputMode === 'price';
             const rent = parseNumber(rentInput.value);
-            const passThrough = parseInt(passThroughInput.value) / 100;
-
-            let propYield;
-            if (inputMode === 'price') {{
-                const price = parseNumber(priceInput.value);
-                if (!rent || !price || rent <= 0 || price <= 0) {{
-                    placeholder.style.display = 'flex';
-                    content.classList.remove('visible');
-                    calcDerived.style.display = 'none';
-                    updateValueChart(0, 0, 0);
-                    return;
-                }}
-                propYield = (rent / price) * 100;
+            const pt = parseInt(passThroughInput.value);
+            const price = priceMode ? parseNumber(priceInput.value) : NaN;
+            const yieldValue = priceMode ? NaN : parseNumber(yieldInput.value);
+
+            const passThrough = pt / 100;
+            const priceValid = priceMode && rent > 0 && price > 0;
+            const propYield = priceMode ? (priceValid ? (rent / price) * 100 : NaN) : yieldValue;
+            const valid = rent > 0 && propYield > 0;
+
+            updateSliderLabel(pt);
+            if (priceValid) {
                 calcDerived.textContent = 'Implied yield: ' + propYield.toFixed(2) + '%';
                 calcDerived.style.display = 'block';
-            }} else {{
-                propYield = parseNumber(yieldInput.value);
+            } else {
                 calcDerived.style.display = 'none';
-            }}
+            }
+            placeholder.classList.toggle('visible', !valid);
+            content.classList.toggle('visible', valid);
 
-            if (!rent || !propYield || rent <= 0 || propYield <= 0) {{
-                placeholder.style.display = 'flex';
-                content.classList.remove('visible');
+            if (!valid) {
                 updateValueChart(0, 0, 0);
                 return;
-            }}
-
-            placeholder.style.display = 'none';
-            content.classList.add('visible');
+            }
 
             const baseValue = rent / (propYield / 100);
             baseValEl.textContent = formatGBP(baseValue);
 
-            // Scenarios: gilt moves from -75bps to +75bps in 25bp steps
-            // Property yield shift = gilt move * pass-through rate
-            const scenarios = [-75, -50, -25, 0, 25, 50, 75];
-            let html = '';
-
-            scenarios.forEach(function(deltaBps) {{
+            scenarios.forEach(function(deltaBps, i) {
+                const row = scenarioRows[i];
                 const effectiveShift = deltaBps * passThrough;
                 const newPropYield = propYield + (effectiveShift / 100);
-                if (newPropYield <= 0) return;
+                const skipped = newPropYield <= 0;
+                row.tr.hidden = skipped;
+                if (skipped) return;
 
                 const newValue = rent / (newPropYield / 100);
+                row.yieldCell.textContent = newPropYield.toFixed(2) + '%';
+                row.valueCell.textContent = formatGBP(newValue);
+                if (deltaBps === 0) return;
+
                 const change = newValue - baseValue;
                 const changePct = (change / baseValue) * 100;
-                const isCurrent = deltaBps === 0;
-
-                const rowClass = isCurrent ? ' class="scenario-current"' : '';
-                const label = isCurrent ? 'Current' : (deltaBps > 0 ? '+' : '') + deltaBps + 'bps';
-
-                let changeCell;
-                if (isCurrent) {{
-                    changeCell = '<td>&mdash;</td>';
-                }} else if (change > 0) {{
-                    changeCell = '<td class="val-positive">+' + formatGBPFull(Math.round(change)) + ' (+' + changePct.toFixed(1) + '%)</td>';
-                }} else {{
-                    changeCell = '<td class="val-negative">' + formatGBPFull(Math.round(change)) + ' (' + changePct.toFixed(1) + '%)</td>';
-                }}
-
-                html += '<tr' + rowClass + '>' +
-                    '<td>' + label + '</td>' +
-                    '<td>' + newPropYield.toFixed(2) + '%</td>' +
-                    '<td>' + formatGBP(newValue) + '</td>' +
-                    changeCell +
-                    '</tr>';
-            }});
-
-            tableBody.innerHTML = html;
+                if (change > 0) {
+                    row.changeCell.className = 'val-positive';
+                    row.changeCell.textContent = '+' + formatGBPFull(Math.round(change)) + ' (+' + changePct.toFixed(1) + '%)';
+                } else {
+                    row.changeCell.className = 'val-negative';
+                    row.changeCell.textContent = formatGBPFull(Math.round(change)) + ' (' + changePct.toFixed(1) + '%)';
+                }
+            });
 
             // Update implied value chart
             updateValueChart(rent, propYield, passThrough);
-        }}
-
-        // Format rent input with commas as user types
-        rentInput.addEventListener('input', function() {{
-            const raw = this.value.replace(/[^0-9]/g, '');
-            if (raw) {{
-                this.value = parseInt(raw).toLocaleString('en-GB');
-            }}
-            recalculate();
-        }});
+        }
 
-        yieldInput.addEventListener('input', recalculate);
-        passThroughInput.addEventListener('input', recalculate);
+        // Coalesce bursts of input events (fast typing, slider drags) into at most
+        // one recalculation per animation frame
+        let recalcPending = false;
+        function scheduleRecalculate() {
+            if (recalcPending) {
+                return;
+            }
+            recalcPending = true;
+            requestAnimationFrame(function() {
+                recalcPending = false;
+                recalculate();
+            });
+        }
 
-        priceInput.addEventListener('input', function() {{
-            const raw = this.value.replace(/[^0-9]/g, '');
-            if (raw) {{
-                this.value = parseInt(raw).toLocaleString('en-GB');
-            }}
-            recalculate();
-        }});
+        // Reformat a digit string with thousands separators, reusing the last result
+        // when the digits have not changed (e.g. caret moves, deleting a comma)
+        let lastDigits = '';
+        let lastFormatted = '';
+        function formatDigits(raw) {
+            if (raw !== lastDigits) {
+                lastDigits = raw;
+                lastFormatted = wholeNumber.format(parseInt(raw));
+            }
+            return lastFormatted;
+        }
 
-        modeYieldBtn.addEventListener('click', function() {{
+        // Format rent input with commas as user types
+        rentInput.addEventListener('input', function() {
+            const raw = stripToDigits(this.value, false);
+            if (raw) {
+                this.value = formatDigits(raw);
+            }
+            scheduleRecalculate();
+        });
+
+        yieldInput.addEventListener('input', scheduleRecalculate);
+        passThroughInput.addEventListener('input', scheduleRecalculate);
+
+        priceInput.addEventListener('input', function() {
+            const raw = stripToDigits(this.value, false);
+            if (raw) {
+                this.value = formatDigits(raw);
+            }
+            scheduleRecalculate();
+        });
+
+        modeYieldBtn.addEventListener('click', function() {
             inputMode = 'yield';
             modeYieldBtn.classList.add('active');
             modePriceBtn.classList.remove('active');
@@ -2047,9 +2221,9 @@ def generate_dashboard(data_points, stats, live_data=None):
             priceWrap.style.display = 'none';
             yieldFieldLabel.textContent = 'Property Yield';
             recalculate();
-        }});
+        });
 
-        modePriceBtn.addEventListener('click', function() {{
+        modePriceBtn.addEventListener('click', function() {
             inputMode = 'price';
             modePriceBtn.classList.add('active');
             modeYieldBtn.classList.remove('active');
@@ -2057,39 +2231,345 @@ def generate_dashboard(data_points, stats, live_data=None):
             priceWrap.style.display = '';
             yieldFieldLabel.textContent = 'Guide Price';
             recalculate();
-        }});
+        });
 
     </script>
 </body>
 </html>"""
 
-    with open(DASHBOARD_FILE, "w", encoding="utf-8") as f:
-        f.write(html)
 
-    print(f"Dashboard saved to {DASHBOARD_FILE}")
-    return DASHBOARD_FILE
+def _strip_lines(text):
+    """Drop indentation, blank lines and whole-line // comments from markup or JS.
+
+    Line breaks are kept so JS automatic semicolon insertion is unaffected. A
+    trailing // comment is only removed from lines with no string literal on them.
+    """
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        if "'" not in line and '"' not in line:
+            line = re.sub(r"\s+//\s.*$", "", line)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace around CSS punctuation; values are left untouched."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+# The static sections are minified and encoded once at import; each render only
+# encodes the body. The stylesheet's name carries a hash of its content, so a
+# changed stylesheet gets a new URL and the old one can be cached forever.
+if DEBUG:
+    DASHBOARD_CSS_BYTES = DASHBOARD_CSS.encode("utf-8")
+    _head, _scripts = DASHBOARD_HEAD, DASHBOARD_SCRIPTS
+else:
+    DASHBOARD_CSS_BYTES = _minify_css(DASHBOARD_CSS).encode("utf-8")
+    _head, _scripts = _strip_lines(DASHBOARD_HEAD) + "\n", _strip_lines(DASHBOARD_SCRIPTS) + "\n"
+CSS_ASSET_NAME = f"gilt.{hashlib.blake2b(DASHBOARD_CSS_BYTES, digest_size=6).hexdigest()}.css"
+DASHBOARD_HEAD_BYTES = _head.format(css_href=f"assets/{CSS_ASSET_NAME}").encode("utf-8")
+DASHBOARD_SCRIPTS_BYTES = _scripts.encode("utf-8")
+del _head, _scripts
+
+
+def write_css_asset():
+    """Write the hashed stylesheet (and a gzip copy) if missing, removing stale versions."""
+    css_path = ASSETS_DIR / CSS_ASSET_NAME
+    if css_path.exists():
+        return
+    ASSETS_DIR.mkdir(exist_ok=True)
+    for stale in ASSETS_DIR.glob("gilt.*.css*"):
+        stale.unlink()
+    _write_atomic(css_path, DASHBOARD_CSS_BYTES)
+    _write_atomic(css_path.with_name(CSS_ASSET_NAME + ".gz"), DASHBOARD_CSS_BYTES, compress=True)
+
+
+@lru_cache(maxsize=4)
+def _chart_series_json(ordinals_raw, yields_raw, max_points=None):
+    """Encode the chart series for the page, memoised on the raw bytes of its columns.
+
+    The BoE series changes at most once a day, but serve mode re-renders every few
+    minutes, so most renders reuse the previous encoding. With max_points, the SMA is
+    computed at full resolution and then every column is sampled at the same M4
+    indices. Returns (packed series JSON, labels JSON, ordinals of the points kept).
+    """
+    ordinals = array("l")
+    ordinals.frombytes(ordinals_raw)
+    chart_yields = array("d")
+    chart_yields.frombytes(yields_raw)
+    sma = moving_average(chart_yields)
+
+    if max_points is not None and len(ordinals) > max_points:
+        keep = m4_indices(chart_yields, max_points)
+        ordinals = array("l", [ordinals[i] for i in keep])
+        chart_yields = array("d", [chart_yields[i] for i in keep])
+        sma = [sma[i] for i in keep]
+
+    # Dates ship as int32 day offsets from the first point, yields and their 30-day
+    # SMA as float32 (NaN before a full window), all base64-packed typed arrays
+    first_date = datetime.fromordinal(ordinals[0])
+    packed_series = {
+        "base": [first_date.year, first_date.month, first_date.day],
+        "days": _pack_b64("i", [o - ordinals[0] for o in ordinals]),
+        "yields": _pack_b64("f", chart_yields),
+        "sma": _pack_b64("f", [float("nan") if v is None else v for v in sma]),
+    }
+    # Tooltip titles, formatted once here rather than on every hover
+    labels_pretty = [f"{d.day} {d:%B %Y}" for d in map(datetime.fromordinal, ordinals)]
+    return _json_dumps(packed_series), _json_dumps(labels_pretty), ordinals
+
+
+def generate_dashboard(data_points, stats, live_data=None, series=None):
+    """Generate the HTML dashboard file; returns the page as a tuple of encoded byte sections."""
+    if series is None:
+        series = index_series(data_points)
+    yields_raw = series["yields"]
+    now = datetime.now()
+    current_dt = _parse_iso(stats["current_date"])
+    updated_time = now.strftime("%d %b %Y at %H:%M")
+    logo_data_uri = load_logo_base64()
+
+    # Determine whether we have live market data
+    has_live = live_data is not None and live_data.get("yield") is not None
+
+    # Adjust historical BoE chart data up to benchmark level if we have live data.
+    # We match the CNBC date to the nearest BoE data point for an accurate spread,
+    # then sanity-check it falls within the expected 0.40–1.00% range.
+    if has_live:
+        # Find the BoE data point closest to the CNBC quote date
+        try:
+            cnbc_ts = live_data["last_time"].split("T")[0]
+            cnbc_date = _parse_iso(cnbc_ts)
+        except (ValueError, KeyError, IndexError):
+            cnbc_date = current_dt
+        matched_boe = find_nearest_value(series, cnbc_date)
+        if matched_boe is None:
+            matched_boe = stats["current_yield"]
+
+        spread = round(live_data["yield"] - matched_boe, 4)
+
+        # Sanity check: benchmark-vs-zero-coupon spread is typically 0.40–1.00%.
+        # If it's outside this range, something is wrong — fall back to no adjustment.
+        SPREAD_MIN, SPREAD_MAX = 0.40, 1.00
+        spread_ok = SPREAD_MIN <= spread <= SPREAD_MAX
+        if not spread_ok:
+            print(f"  Warning: Benchmark spread {spread:.2f}% outside expected range "
+                  f"({SPREAD_MIN}–{SPREAD_MAX}%). Using unadjusted BoE data.")
+            spread = 0
+    else:
+        spread = 0
+        spread_ok = False
+
+    # Chart yields as a single typed column: shifted to benchmark level and re-rounded in
+    # one pass, or the cached BoE column as-is (already rounded at parse time).
+    if spread_ok:
+        chart_yields = array("d", [round(y + spread, 4) for y in yields_raw])
+    else:
+        chart_yields = yields_raw
+    # Under GILT_TRACKER_DEBUG every point is embedded, bypassing the M4 downsample
+    packed_series_json, labels_pretty_json, chart_ordinals = _chart_series_json(
+        series["ordinals"].tobytes(), chart_yields.tobytes(), None if DEBUG else MAX_CHART_POINTS
+    )
+
+    # First point index of each timeframe button's window; 1Y shows the whole series
+    window_offsets = {
+        str(months): bisect_left(chart_ordinals, months_before(now, months).toordinal())
+        for months in (1, 3, 6)
+    }
+    window_offsets["12"] = 0
+
+    def fmt_change(val):
+        if val is None:
+            return "N/A", ""
+        sign = "+" if val >= 0 else ""
+        css = "positive" if val > 0 else "negative" if val < 0 else ""
+        return f"{sign}{val:.2f}%", css
+
+    # Use live CNBC daily change if available, BoE for period changes
+    if has_live:
+        daily_str, daily_css = fmt_change(live_data.get("change"))
+    else:
+        daily_str, daily_css = fmt_change(stats.get("daily_change"))
+    changes = (
+        ("Daily Change", daily_str, daily_css),
+        ("Weekly", *fmt_change(stats.get("week_change"))),
+        ("Monthly", *fmt_change(stats.get("month_change"))),
+        ("YTD", *fmt_change(stats.get("ytd_change"))),
+    )
+    change_badges_html = "\n".join(
+        CHANGE_BADGE_FRAGMENT.format(label, css, text) for label, text, css in changes
+    )
+
+    # Use live yield as headline if available, else fall back to BoE
+    if has_live:
+        current_yield = live_data["yield"]
+        headline_source = "Live"
+    else:
+        current_yield = stats["current_yield"]
+        headline_source = "BoE"
+
+    implied_borrowing = current_yield + PROPERTY_LENDING_SPREAD_BPS / 100
+    yield_3m_ago = find_nearest_value(series, current_dt - timedelta(days=90))
+    yield_direction = "fallen" if stats.get("month_change", 0) < 0 else "risen"
+    direction_impact = "reducing" if yield_direction == "fallen" else "increasing"
+    valuation_impact = "upward" if yield_direction == "fallen" else "downward"
+
+    # 12-month high/low: prefer CNBC 52-week data if available
+    if has_live and live_data.get("yr_high") is not None:
+        high_12m = live_data["yr_high"]
+        low_12m = live_data["yr_low"]
+        high_12m_display = format_cnbc_date_display(live_data.get("yr_high_date", ""))
+        low_12m_display = format_cnbc_date_display(live_data.get("yr_low_date", ""))
+    else:
+        high_12m = stats["high_12m"]
+        low_12m = stats["low_12m"]
+        high_12m_display = format_date_display(stats["high_date"])
+        low_12m_display = format_date_display(stats["low_date"])
 
+    # Month-ago borrowing cost for summary callout
+    month_change = stats.get("month_change", 0)
+    month_bps = abs(month_change) * 100
+    month_ago_yield = current_yield - month_change
+    borrowing_verb = "reducing" if month_change < 0 else "increasing"
 
+    # Data freshness info
+    live_time_short = ""  # compact time for yield hero (e.g. "09:26 GMT")
+    if has_live and live_data.get("last_time"):
+        # Parse CNBC timestamp like "2026-02-26T09:22:08.000+0000"
+        try:
+            live_ts = live_data["last_time"].replace("+0000", "+00:00").split(".")[0]
+            live_dt = _strptime(live_ts, "%Y-%m-%dT%H:%M:%S")
+            data_freshness = f"Live: {live_dt.strftime('%d %b %Y at %H:%M')} GMT"
+            live_time_short = f"as at {live_dt.strftime('%d %b %Y')}, {live_dt.strftime('%H:%M')} GMT"
+        except (ValueError, IndexError):
+            data_freshness = "Live market data"
+            live_time_short = "live"
+    else:
+        data_lag_days = (now - current_dt).days
+        latest_data_display = format_date_display(stats["current_date"])
+        data_freshness = f"Latest data: {latest_data_display} ({data_lag_days}d lag)"
+
+    # Bond details for display
+    bond_coupon = live_data.get("coupon", "") if has_live else ""
+    raw_maturity = live_data.get("maturity", "") if has_live else ""
+    # Format maturity date nicely (e.g. "2054-07-31" -> "July 2054")
+    try:
+        mat_dt = _parse_iso(raw_maturity)
+        bond_maturity = mat_dt.strftime("%B %Y")
+    except (ValueError, TypeError):
+        bond_maturity = raw_maturity
+
+    # Header subtitle
+    if has_live:
+        header_subtitle = "Benchmark Bond Yield &middot; Live Market Data"
+    else:
+        header_subtitle = f"Nominal Zero Coupon &middot; Series {SERIES_CODE} &middot; Bank of England"
+
+
+    body_html = DASHBOARD_BODY_TEMPLATE.format_map({
+        "header_subtitle": header_subtitle,
+        "updated_time": updated_time,
+        "data_freshness": data_freshness,
+        "logo_html": _logo_html(logo_data_uri),
+        "current_yield": current_yield,
+        "live_time_html": LIVE_TIME_FRAGMENT.format(live_time_short) if live_time_short else "",
+        "change_badges_html": change_badges_html,
+        "trend_summary_html": _trend_summary_html(chart_yields),
+        "yield_direction": yield_direction,
+        "month_change_abs": abs(month_change),
+        "month_bps": month_bps,
+        "borrowing_verb": borrowing_verb,
+        "high_12m": high_12m,
+        "high_12m_display": high_12m_display,
+        "low_12m": low_12m,
+        "low_12m_display": low_12m_display,
+        "range_12m": high_12m - low_12m,
+        "implied_borrowing": implied_borrowing,
+        "lending_spread_bps": PROPERTY_LENDING_SPREAD_BPS,
+        "chart_subtitle": (
+            f"Adjusted to benchmark level (+{spread:.2f}% spread applied to BoE yield curve)"
+            if spread_ok else "Daily nominal zero coupon 30-year gilt yield (%)"
+        ),
+        "bond_details": (
+            BOND_DETAILS_FRAGMENT.format(bond_coupon, bond_maturity) if bond_coupon and bond_maturity else ""
+        ),
+        # The chart JSON is spliced in as cached text; "</" is escaped so nothing in the
+        # payload can close its script element
+        "payload_json": (
+            f'{{"series":{packed_series_json},"labels":{labels_pretty_json},'
+            f'"windowOffsets":{_json_dumps(window_offsets)},"currentGilt":{_json_dumps(current_yield)}}}'
+        ).replace("</", "<\\/"),
+    })
+
+    write_css_asset()
+
+    # The page goes to disk as its three encoded sections, never joined into one buffer.
+    # Skip the writes and compression entirely when its digest matches the last page written.
+    page = (DASHBOARD_HEAD_BYTES, body_html.encode("utf-8"), DASHBOARD_SCRIPTS_BYTES)
+    digest = _digest(page)
+    if (digest == _read_digest(DASHBOARD_HASH_FILE)
+            and DASHBOARD_FILE.exists() and DASHBOARD_GZ_FILE.exists()):
+        print(f"Dashboard unchanged, left {DASHBOARD_FILE} as is")
+    else:
+        _write_atomic(DASHBOARD_FILE, page)
+        _write_atomic(DASHBOARD_GZ_FILE, page, compress=True)
+        _write_atomic(DASHBOARD_HASH_FILE, digest.encode("ascii"))
+        print(f"Dashboard saved to {DASHBOARD_FILE}")
+    return page
+
+
+@lru_cache(maxsize=256)
 def format_date_display(date_str):
-    """Format a YYYY-MM-DD date for display."""
+    """Format a YYYY-MM-DD date for display; memoized, as the same few dates recur every refresh."""
     try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.strftime("%d %b %Y")
+        dt = _parse_iso(date_str)
+        return dt.strftime(DISPLAY_DATE_FORMAT)
     except (ValueError, TypeError):
         return date_str
 
 
-def fetch_and_generate():
-    """Fetch fresh data and generate the dashboard. Returns (data_points, stats, live_data)."""
-    data_points = fetch_gilt_data()
+@lru_cache(maxsize=64)
+def format_cnbc_date_display(date_str):
+    """Format a CNBC MM/DD/YY date for display, passing unparseable values through."""
+    if not date_str:
+        return ""
+    try:
+        return _strptime(date_str, CNBC_DATE_FORMAT).strftime(DISPLAY_DATE_FORMAT)
+    except ValueError:
+        return date_str
+
+
+def fetch_and_generate(previous=None):
+    """Fetch fresh data and generate the dashboard. Returns (data_points, stats, live_data, page).
+
+    previous is an earlier return value. When the BoE history has not changed since
+    then, its stats are reused and data.json is left alone, so only the page is
+    re-rendered around the latest live quote.
+    """
+    # BoE history and the CNBC live quote come from different hosts, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        boe_future = executor.submit(fetch_gilt_data)
+        live_future = executor.submit(fetch_live_gilt_yield)
+        data_points = boe_future.result()
+        live_data = live_future.result()
+
     if not data_points:
         raise RuntimeError("No data points received from Bank of England API.")
 
-    stats = compute_stats(data_points)
-    save_data(data_points, stats)
-
-    # Fetch live benchmark yield from CNBC
-    live_data = fetch_live_gilt_yield()
+    series = index_series(data_points)
+    if previous is not None and data_points == previous[0]:
+        print("  BoE data unchanged since the last refresh; reusing its stats")
+        stats = previous[1]
+    else:
+        stats = compute_stats(data_points, series)
+        save_data(data_points, stats)
 
     headline = live_data["yield"] if live_data else stats["current_yield"]
     print(f"  Headline Yield: {headline:.2f}% ({'live' if live_data else 'BoE'})")
@@ -2101,47 +2581,112 @@ def fetch_and_generate():
     print(f"  12M High:       {stats['high_12m']:.2f}%  ({format_date_display(stats['high_date'])})")
     print(f"  12M Low:        {stats['low_12m']:.2f}%  ({format_date_display(stats['low_date'])})")
 
-    generate_dashboard(data_points, stats, live_data=live_data)
-    return data_points, stats, live_data
+    page = generate_dashboard(data_points, stats, live_data=live_data, series=series)
+    return data_points, stats, live_data, page
 
 
 def serve_dashboard(port=8080):
-    """Run a local server that fetches fresh BoE data on each page refresh."""
+    """Run a local server whose page is refreshed with fresh data in a background thread."""
     import http.server
-    import time
     import socket
-
-    # Cache so rapid refreshes don't hammer the BoE API
-    cache = {"html": None, "time": 0}
+    import threading
+
+    # Latest rendered page bytes straight from generate_dashboard, so nothing is re-read
+    # or re-encoded per request. Only the refresh thread writes it, under cache_lock.
+    cache = {"html": None, "gz": None, "etag": None, "error": None}
+    cache_lock = threading.Lock()
+    # The last fetch_and_generate result, only touched by the refresh thread
+    last_result = None
     CACHE_TTL = 300  # 5 minutes (BoE data only updates once daily)
+    RETRY_DELAY = 60  # seconds before retrying when there is no page to serve yet
+    # Responses are compressed once per refresh (or once at startup for the static
+    # stylesheet) and sent as-is to every client that accepts gzip
+    css_gz = gzip.compress(DASHBOARD_CSS_BYTES, compresslevel=6, mtime=0)
+
+    def refresh():
+        """Fetch and render a fresh page, then swap it into the cache."""
+        nonlocal last_result
+        print(f"\n  Fetching fresh data from Bank of England...")
+        try:
+            last_result = fetch_and_generate(previous=last_result)
+            html = b"".join(last_result[3])
+        except Exception as e:
+            print(f"  Error refreshing data: {e}")
+            with cache_lock:
+                cache["error"] = e
+            return
+        gz = gzip.compress(html, compresslevel=6, mtime=0)
+        etag = _digest((html,))
+        with cache_lock:
+            cache.update(html=html, gz=gz, etag=etag, error=None)
+        print(f"  Data refreshed successfully.\n")
+
+    def refresh_loop():
+        while True:
+            with cache_lock:
+                has_page = cache["html"] is not None
+            time.sleep(CACHE_TTL if has_page else RETRY_DELAY)
+            refresh()
 
     class Handler(http.server.BaseHTTPRequestHandler):
+        # Headers and body go out as separate writes; with Nagle on, the body can sit
+        # in the kernel until the client ACKs the headers, so set TCP_NODELAY
+        disable_nagle_algorithm = True
+
+        def send_body(self, body, gz_body, content_type, cache_control, etag=None):
+            """Send a 200 response, using the precompressed body if the client accepts gzip.
+
+            With an etag, a request whose If-None-Match already holds it gets a bodiless
+            304. The gzip and identity bodies carry distinct tags.
+            """
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            if etag is not None:
+                etag = f'"{etag}-gzip"' if use_gzip else f'"{etag}"'
+                client_tags = {
+                    tag.strip().removeprefix("W/") for tag in self.headers.get("If-None-Match", "").split(",")
+                }
+                if etag in client_tags or "*" in client_tags:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", cache_control)
+                    self.send_header("Vary", "Accept-Encoding")
+                    self.end_headers()
+                    return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            if etag is not None:
+                self.send_header("ETag", etag)
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+                body = gz_body
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
         def do_GET(self):
+            if self.path == f"/assets/{CSS_ASSET_NAME}":
+                self.send_body(DASHBOARD_CSS_BYTES, css_gz, "text/css; charset=utf-8",
+                               "public, max-age=31536000, immutable")
+                return
+
             if self.path not in ("/", "/index.html"):
                 self.send_response(204)
                 self.end_headers()
                 return
 
-            now = time.time()
-            if cache["html"] is None or (now - cache["time"]) > CACHE_TTL:
-                try:
-                    print(f"\n  Fetching fresh data from Bank of England...")
-                    fetch_and_generate()
-                    with open(DASHBOARD_FILE, "r", encoding="utf-8") as f:
-                        cache["html"] = f.read()
-                    cache["time"] = now
-                    print(f"  Data refreshed successfully.\n")
-                except Exception as e:
-                    print(f"  Error refreshing data: {e}")
-                    if cache["html"] is None:
-                        self.send_error(500, f"Failed to fetch data: {e}")
-                        return
+            # Never fetch on the request path; serve whatever the refresh thread last rendered
+            with cache_lock:
+                html, gz, etag, error = cache["html"], cache["gz"], cache["etag"], cache["error"]
+            if html is None:
+                self.send_error(500, f"Failed to fetch data: {error}")
+                return
 
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-            self.end_headers()
-            self.wfile.write(cache["html"].encode("utf-8"))
+            # no-cache (rather than no-store) lets the browser keep the page and
+            # revalidate it with If-None-Match, which costs a 304 until the next refresh
+            self.send_body(html, gz, "text/html; charset=utf-8", "no-cache", etag=etag)
 
         def log_message(self, format, *args):
             pass  # Suppress default request logging
@@ -2149,7 +2694,7 @@ def serve_dashboard(port=8080):
     # Try the requested port, then fall back to alternatives
     for try_port in [port, 8081, 8082, 5500, 0]:
         try:
-            server = http.server.HTTPServer(("127.0.0.1", try_port), Handler)
+            server = http.server.ThreadingHTTPServer(("127.0.0.1", try_port), Handler)
             actual_port = server.server_address[1]
             break
         except OSError:
@@ -2158,9 +2703,13 @@ def serve_dashboard(port=8080):
             print(f"  Port {try_port} in use, trying next...")
             continue
 
+    # Render the first page before opening the browser, then keep it fresh in the background
+    refresh()
+    threading.Thread(target=refresh_loop, name="dashboard-refresh", daemon=True).start()
+
     url = f"http://127.0.0.1:{actual_port}"
     print(f"\n  Dashboard server running at {url}")
-    print(f"  Refresh the page to see updated data (cached for {CACHE_TTL // 60} min).")
+    print(f"  Data refreshes in the background every {CACHE_TTL // 60} min; refresh the page to see it.")
     print(f"  Press Ctrl+C to stop.\n")
     webbrowser.open(url)
 